@@ -1,63 +1,84 @@
-"""
-Breeze Trading Client
-=====================
+"""Breeze Trading Client — trader-friendly wrapper for ICICI Direct's Breeze API.
 
-A trader-friendly Python wrapper for ICICI Direct's Breeze API.
+Type-only references to the lazily-imported classes should use
+``if TYPE_CHECKING:`` imports so annotations never trigger the eager
+import path this module is designed to avoid.
+"""
 
-Simple by default, advanced when needed, nothing hidden.
+from __future__ import annotations
 
-Usage:
-    >>> from breeze_client import BreezeTrader
-    >>> trader = BreezeTrader()
-    >>> trader.buy("RELIANCE", 10)
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-For detailed documentation, see: docs/
-"""
+if TYPE_CHECKING:
+    from .client import BreezeTrader
 
 __version__ = "1.0.0"
+# Parsed once so dependents can compare versions numerically instead of
+# lexicographically (which breaks at 1.10 vs 1.9).
+__version_info__ = tuple(int(p) for p in __version__.split(".") if p.isdigit())
 __author__ = "Your Name"
 
-# Core infrastructure (Phase 2 - Complete)
-from .config_manager import ConfigManager
-from .session_manager import SessionManager
-from .exceptions import (
-    BreezeTraderError,
-    ConfigurationError,
-    SessionExpiredError,
-    SessionNotFoundError,
-    OrderValidationError,
-    InsufficientFundsError,
-    MarketClosedError,
-    RateLimitError,
-    AuthenticationError,
-    InvalidStockCodeError,
-    OrderNotFoundError,
-    NetworkError,
-    WebSocketError,
-)
-
-# Main client class (Phases 3, 4, 5 - Complete)
-from .client import BreezeTrader
-
-__all__ = [
-    # Main client
+# Exceptions are lightweight and commonly needed at import time
+# (e.g. for except clauses), so they stay eagerly imported.
+# The name list lives in exceptions.__all__ so adding an exception
+# there is enough to re-export it here.
+from . import exceptions as _exc
+from .exceptions import *  # noqa: F401,F403
+
+# Heavy submodules (client pulls in the breeze-connect SDK, websockets,
+# requests, etc.) are loaded lazily on first attribute access (PEP 562),
+# so `import breeze_client` stays cheap for users who only need a subset.
+_LAZY_IMPORTS = {
+    'BreezeTrader': ('breeze_client.client', 'BreezeTrader'),
+    'ConfigManager': ('breeze_client.config_manager', 'ConfigManager'),
+    'SessionManager': ('breeze_client.session_manager', 'SessionManager'),
+}
+
+# Tuple rather than list: __all__ is only ever read, and deriving the
+# exception portion from exceptions.__all__ keeps the two in sync.
+__all__ = (
     "BreezeTrader",
-    # Core infrastructure
     "ConfigManager",
     "SessionManager",
-    # Exceptions
-    "BreezeTraderError",
-    "ConfigurationError",
-    "SessionExpiredError",
-    "SessionNotFoundError",
-    "OrderValidationError",
-    "InsufficientFundsError",
-    "MarketClosedError",
-    "RateLimitError",
-    "AuthenticationError",
-    "InvalidStockCodeError",
-    "OrderNotFoundError",
-    "NetworkError",
-    "WebSocketError",
-]
+    "get_default_trader",
+) + tuple(_exc.__all__)
+
+
+@lru_cache(maxsize=4)
+def get_default_trader(config_path: str = 'config.yaml') -> BreezeTrader:
+    """
+    Get a shared BreezeTrader instance for the given config file.
+
+    Construction (config load, session restore, SDK authentication) is
+    done once per config path; repeated calls return the same instance,
+    which keeps its HTTP connection pool and websocket alive.
+
+    Example:
+        >>> from breeze_client import get_default_trader
+        >>> trader = get_default_trader()
+        >>> trader.buy("RELIANCE", 10)
+    """
+    from .client import BreezeTrader
+    return BreezeTrader(config_path=config_path)
+
+
+def __getattr__(name: str):
+    """Lazily import heavy submodules on first attribute access (PEP 562)."""
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr_name)
+
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    """Keep tab-completion working for lazily-imported names."""
+    return sorted(__all__)
@@ -0,0 +1,119 @@
+"""
+Breeze Trading Client - Order Micro-Batcher
+
+Collapses bursts of GTT/order calls into periodic flushes so rapid
+callers pay one batch round-trip instead of N sequential ones.
+"""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class OrderBatcher:
+    """
+    Async micro-batching queue for order/GTT placement.
+
+    Calls submitted within one flush window (default 100ms) or up to
+    max_batch_size are collected and fired together on a background
+    task. Cancels are flushed before placements so risk-reducing calls
+    never queue behind new orders. Each submission gets an
+    asyncio.Future resolved with that call's own response.
+
+    The underlying Breeze API has no multi-order endpoint, so a flush
+    fans the batch out over the event loop's thread pool; the win is
+    coalesced scheduling and a single rate-limit burst per window.
+
+    Example:
+        >>> batcher = OrderBatcher(trader)
+        >>> future = batcher.submit(trader.place_gtt, "RELIANCE",
+        ...                         quantity=10, trigger_price=2900)
+        >>> response = await future
+    """
+
+    def __init__(
+        self,
+        trader,
+        interval_ms: int = 100,
+        max_batch_size: int = 15
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            trader: BreezeTrader instance whose methods are batched
+            interval_ms: Flush window in milliseconds (default: 100)
+            max_batch_size: Maximum calls per flush (default: 15)
+        """
+        self._trader = trader
+        self._interval = interval_ms / 1000.0
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def submit(self, method: Callable, *args: Any, **kwargs: Any) -> 'asyncio.Future':
+        """
+        Queue a call for the next flush.
+
+        Must be called from a running event loop.
+
+        Args:
+            method: Bound trader method to invoke (e.g. trader.place_gtt)
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            asyncio.Future: Resolved with the call's response (or its
+            exception) once the batch containing it has flushed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put_nowait((method, args, kwargs, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_loop())
+
+        return future
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue in windowed batches until it stays empty."""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            batch: List[Tuple[Callable, tuple, dict, asyncio.Future]] = [
+                self._queue.get_nowait()
+            ]
+
+            # Collect until the window closes or the batch is full
+            deadline = loop.time() + self._interval
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+
+            # Cancels flush before placements (risk-reducing first)
+            batch.sort(key=lambda item: 0 if 'cancel' in item[0].__name__ else 1)
+
+            await asyncio.gather(
+                *(self._dispatch(loop, *item) for item in batch)
+            )
+
+    @staticmethod
+    async def _dispatch(loop, method, args, kwargs, future) -> None:
+        """Run one blocking SDK call off-loop and resolve its future."""
+        if future.cancelled():
+            return
+        try:
+            result = await loop.run_in_executor(
+                None, lambda: method(*args, **kwargs)
+            )
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        else:
+            if not future.cancelled():
+                future.set_result(result)
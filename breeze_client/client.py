@@ -5,10 +5,24 @@ A trader-friendly wrapper around the official breeze-connect SDK.
 Simple by default, advanced when needed, nothing hidden.
 """
 
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import copy
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Callable
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from breeze_connect import BreezeConnect
+if TYPE_CHECKING:
+    from breeze_connect import BreezeConnect
 
 from .config_manager import ConfigManager
 from .session_manager import SessionManager
@@ -20,11 +34,144 @@ from .exceptions import (
 )
 from .utils import (
     resolve_parameter_aliases,
-    merge_dicts,
     setup_logging,
 )
 
 
+# Sentinel distinguishing "not cached" from cached falsy responses
+_CACHE_MISS = object()
+
+# Time-of-day suffix appended to YYYY-MM-DD dates for the history API
+_DATE_SUFFIX = "T07:00:00.000Z"
+
+
+def _orjson_response_hook(response, **kwargs):
+    """
+    requests response hook that swaps ``response.json`` for an orjson decoder.
+
+    Historical-data and portfolio responses can run to megabytes of JSON;
+    orjson decodes them several times faster than the stdlib parser. The
+    instance attribute shadows ``Response.json``, so the SDK's existing
+    ``response.json()`` calls pick up the fast path unchanged.
+    """
+    import orjson
+
+    def _json(**_kwargs):
+        return orjson.loads(response.content)
+
+    response.json = _json
+    return response
+
+
+def _to_sdk_str(value: Any) -> str:
+    """
+    Coerce a parameter value to the string form the SDK expects.
+
+    Fast path: values that are already strings (the common case for
+    prices passed as strings) are returned as-is without a str() call;
+    None becomes the empty string the SDK treats as "not set".
+    """
+    if type(value) is str:
+        return value
+    if value is None:
+        return ''
+    return str(value)
+
+
+class _TickDispatcher:
+    """
+    Hands ticks from the WebSocket reader thread to user callbacks.
+
+    The SDK invokes tick callbacks on its WS reader thread, so slow
+    strategy code there delays socket reads and backs up the feed.
+    Ticks are instead pushed onto a bounded queue and consumed by a
+    dedicated daemon thread; when the consumer can't keep up, new ticks
+    are dropped and counted in dropped_ticks rather than stalling the
+    socket.
+    """
+
+    _STOP = object()
+
+    def __init__(self, callback: Callable, maxsize: int = 10000):
+        """
+        Start the consumer thread.
+
+        Args:
+            callback: Called with each tick on the consumer thread
+            maxsize: Queue bound; ticks beyond it are dropped
+        """
+        self._callback = callback
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.dropped_ticks = 0
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._tick_loop, name='breeze-ticks', daemon=True
+        )
+        self._thread.start()
+
+    def push(self, tick: Any) -> None:
+        """Enqueue one tick from the WS thread (never blocks)."""
+        try:
+            self._queue.put_nowait(tick)
+        except queue.Full:
+            self.dropped_ticks += 1
+
+    def _tick_loop(self) -> None:
+        """Consume ticks until stop(); callback errors don't kill the loop."""
+        while True:
+            tick = self._queue.get()
+            # The flag covers the case where the queue was too full for
+            # stop() to enqueue the sentinel
+            if tick is self._STOP or self._stopping:
+                break
+            try:
+                self._callback(tick)
+            except Exception:
+                logging.getLogger('breeze_client').exception(
+                    "Tick callback raised"
+                )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Signal the consumer to exit and join it.
+
+        Never blocks on a full queue: if the consumer is wedged in a
+        slow callback at capacity — the overload case this class exists
+        for — a blocking put here would hang ws_disconnect() forever.
+        The sentinel is enqueued without blocking (dropping one queued
+        tick to make room if needed) and the flag covers the remaining
+        races; the join is bounded by timeout either way.
+        """
+        self._stopping = True
+        try:
+            self._queue.put_nowait(self._STOP)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+                self._queue.put_nowait(self._STOP)
+            except (queue.Empty, queue.Full):
+                pass
+        self._thread.join(timeout)
+
+
+def _extract_success(response: Optional[Dict[str, Any]], default: Any = None) -> Any:
+    """
+    Extract the 'Success' payload from an SDK response envelope.
+
+    Centralizes the `response and response.get('Success')` pattern used
+    after every read call: one dict lookup instead of a get() followed by
+    a __getitem__, and one place defining what an empty response yields.
+
+    Args:
+        response: Raw SDK response dict (may be None)
+        default: Value returned when there is no payload (default: [])
+    """
+    success = response.get('Success') if response else None
+    if success is not None:
+        return success
+    return [] if default is None else default
+
+
 class BreezeTrader:
     """
     Main trading client for ICICI Direct Breeze API.
@@ -47,7 +194,87 @@ class BreezeTrader:
         >>> trader.buy("RELIANCE", 10)
         >>> trader.get_portfolio()
     """
-    
+
+    # Fixed attribute layout: no per-instance __dict__, so attribute
+    # access skips a dict lookup and multi-account setups pay a smaller
+    # footprint per trader. (_http_session stays a class attribute.)
+    __slots__ = (
+        '_config_manager',
+        '_session_manager',
+        '_logger',
+        '_default_exchange',
+        '_default_product',
+        '_confirm_orders',
+        '_show_order_confirmations',
+        '_alert_on_session_expiry',
+        '_warn_before_expiry_minutes',
+        '_session_check_cache_seconds',
+        '_batch_pool_size',
+        '_quote_cache_ttl_ms',
+        '_portfolio_cache_ttl_ms',
+        '_funds_cache_ttl_ms',
+        '_response_cache',
+        '_base_order_params',
+        '_base_gtt_params',
+        '_session_check_valid_until',
+        '_breeze_sdk',
+        '_sdk_place_order',
+        '_executor',
+        '_order_batcher',
+        '_subscribed_by_exchange',
+        '_tick_callbacks',
+        '_tick_dispatcher',
+    )
+
+    # Keys forwarded to the SDK's place_gtt_order (plus the per-type
+    # trigger/limit or order_details fields added at call time)
+    _GTT_PARAM_KEYS = (
+        'stock_code',
+        'exchange_code',
+        'product',
+        'action',
+        'quantity',
+        'gtt_type',
+        'expiry_date',
+        'right',
+        'strike_price',
+    )
+
+    # Shared keep-alive HTTP session (one per process, reused across
+    # BreezeTrader instances) so SDK calls hit urllib3's connection pool
+    # instead of paying a TCP+TLS handshake per request.
+    _http_session: Optional[requests.Session] = None
+
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        """Get (or lazily create) the shared pooled HTTP session."""
+        if cls._http_session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=retry,
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['Connection'] = 'keep-alive'
+            session.headers['Keep-Alive'] = 'timeout=90, max=1000'
+            # Fast JSON decoding is optional: skip the hook when orjson
+            # is not installed and fall back to the stdlib parser.
+            try:
+                import orjson  # noqa: F401
+            except ImportError:
+                pass
+            else:
+                session.hooks['response'].append(_orjson_response_hook)
+            cls._http_session = session
+        return cls._http_session
+
     def __init__(self, config_path: str = 'config.yaml'):
         """
         Initialize BreezeTrader client.
@@ -73,12 +300,110 @@ class BreezeTrader:
             date_format=log_config.get('date_format'),
         )
         
+        # Snapshot hot config values onto instance attributes so the
+        # order/quote hot paths do plain attribute loads instead of
+        # dotted-key config walks per call
+        self._refresh_defaults()
+
+        # TTL cache for the polled read endpoints (quotes, portfolio,
+        # positions, funds, margin): {key: (timestamp, response)}
+        self._response_cache: Dict[tuple, tuple] = {}
+
+        # Background executor for fire-and-forget order submission
+        # (threads are started lazily on first submit)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._config_manager.get('trading.max_inflight_orders', 16),
+            thread_name_prefix='breeze-order',
+        )
+
+        # Micro-batching queue for GTT calls; created lazily on the
+        # first batch=True submission (needs a running event loop)
+        self._order_batcher = None
+
+        # Live-feed bookkeeping: which symbols are already streaming
+        # per exchange, and which callbacks want each symbol's ticks
+        self._subscribed_by_exchange: Dict[str, set] = {}
+        self._tick_callbacks: Dict[str, List[Callable]] = {}
+
+        # Off-WS-thread tick delivery; created on first subscription
+        self._tick_dispatcher: Optional[_TickDispatcher] = None
+
+        # _check_session() result is cached until this monotonic
+        # deadline so hot loops skip per-call session file re-reads
+        self._session_check_valid_until: float = 0.0
+
         # Initialize SDK
         self._breeze_sdk: Optional[BreezeConnect] = None
         self._initialize_sdk()
         
         self._logger.info("BreezeTrader initialized successfully")
-    
+
+    def _refresh_defaults(self) -> None:
+        """
+        Snapshot hot config values onto instance attributes.
+
+        The trading hot paths read these as plain attribute loads
+        instead of walking dotted config keys per call. Called from
+        __init__ and reload_config().
+        """
+        get = self._config_manager.get
+        self._default_exchange = get('trading.default_exchange', 'NSE')
+        self._default_product = get('trading.default_product', 'cash')
+        self._confirm_orders = get('trading.confirm_orders', False)
+        self._show_order_confirmations = get(
+            'notifications.show_order_confirmations', True)
+        self._alert_on_session_expiry = get(
+            'notifications.alert_on_session_expiry', True)
+        self._warn_before_expiry_minutes = get(
+            'session.warn_before_expiry_minutes', 60)
+        self._session_check_cache_seconds = get(
+            'session.validity_cache_seconds', 300)
+        self._batch_pool_size = get('trading.batching.thread_pool_size', 8)
+        self._quote_cache_ttl_ms = get('trading.quote_cache_ttl_ms', 100)
+        self._portfolio_cache_ttl_ms = get('trading.portfolio_cache_ttl_ms', 5000)
+        self._funds_cache_ttl_ms = get('trading.funds_cache_ttl_ms', 2000)
+
+        # Order-parameter template: hard defaults (layer 1) merged with
+        # config defaults (layer 2) once, so place_order only has to
+        # splat user kwargs (layer 3) on top
+        self._base_order_params = {
+            'order_type': 'market',
+            'price': '0',
+            'validity': 'day',
+            'stoploss': '',
+            'disclosed_quantity': '0',
+            'expiry_date': '',
+            'right': '',
+            'strike_price': '',
+            'user_remark': '',
+            'order_type_fresh': '',
+            'order_rate_fresh': '',
+            'exchange_code': self._default_exchange,
+            'product': self._default_product,
+        }
+
+        # GTT-parameter template, same layering as _base_order_params
+        self._base_gtt_params = {
+            'product': 'cash',
+            'action': 'buy',
+            'quantity': '',
+            'gtt_type': 'single',
+            'expiry_date': '',
+            'right': '',
+            'strike_price': '',
+            'exchange_code': self._default_exchange,
+        }
+
+    def reload_config(self) -> None:
+        """
+        Re-read the config file and refresh the cached defaults.
+
+        Use after editing config.yaml at runtime; the snapshot taken at
+        __init__ is otherwise held for the lifetime of the client.
+        """
+        self._config_manager = ConfigManager(str(self._config_manager.config_path))
+        self._refresh_defaults()
+
     def _initialize_sdk(self) -> None:
         """
         Initialize and authenticate with Breeze SDK.
@@ -104,7 +429,7 @@ class BreezeTrader:
         
         # Warn if session expiring soon
         warning = self._session_manager.warn_if_expiring_soon(
-            self._config_manager.get('session.warn_before_expiry_minutes', 60)
+            self._warn_before_expiry_minutes
         )
         if warning:
             self._logger.warning(warning)
@@ -117,8 +442,22 @@ class BreezeTrader:
         
         # Initialize SDK
         try:
+            # Imported here rather than at module load: the SDK's
+            # transitive imports (requests, websocket-client, pandas)
+            # dominate `import breeze_client.client` time for scripts
+            # that never go online
+            from breeze_connect import BreezeConnect
+
             self._breeze_sdk = BreezeConnect(api_key=api_key)
-            
+
+            # Route the SDK's HTTP calls through the shared keep-alive
+            # session. The SDK calls module-level requests.get/post/etc.;
+            # a requests.Session is call-compatible with those, so
+            # swapping the module attribute gives every SDK request
+            # connection pooling and retry behaviour.
+            import breeze_connect.breeze_connect as _sdk_module
+            _sdk_module.requests = self._get_http_session()
+
             # Generate session
             response = self._breeze_sdk.generate_session(
                 api_secret=secret_key,
@@ -131,10 +470,18 @@ class BreezeTrader:
                     raise AuthenticationError(f"Session generation failed: {response.get('Error')}")
             
             self._logger.info("SDK session generated successfully")
-            
+
+            # Cache signed request headers within the signature window
+            self._install_header_cache()
+
+            # Bind the hot-path SDK method once; avoids the attribute
+            # lookup on every order submission
+            self._sdk_place_order = self._breeze_sdk.place_order
+
+
         except Exception as e:
-            self._logger.error(f"SDK initialization failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("SDK initialization failed: %s", e)
+            raise self._sdk_error(e)
     
     # ==================== ORDER MANAGEMENT ====================
     
@@ -234,54 +581,44 @@ class BreezeTrader:
         
         # Resolve parameter aliases
         kwargs = resolve_parameter_aliases(kwargs)
-        
-        # Build parameters with three-layer resolution
-        # Layer 1: Hard defaults
-        defaults = {
-            'order_type': 'market',
-            'price': '0',
-            'validity': 'day',
-            'stoploss': '',
-            'disclosed_quantity': '0',
-            'expiry_date': '',
-            'right': '',
-            'strike_price': '',
-            'user_remark': '',
-            'order_type_fresh': '',
-            'order_rate_fresh': '',
-        }
-        
-        # Layer 2: Config defaults
-        config_defaults = {
-            'exchange_code': self._config_manager.get('trading.default_exchange', 'NSE'),
-            'product': self._config_manager.get('trading.default_product', 'cash'),
-        }
-        
-        # Layer 3: User provided (via kwargs)
-        # Merge all layers
-        params = merge_dicts(defaults, config_defaults, kwargs)
+
+        # Hard and config defaults are merged once at __init__; user
+        # kwargs layer on top with a single dict splat per call
+        params = {**self._base_order_params, **kwargs}
         
         # Convert types to strings as required by SDK
-        params['quantity'] = str(quantity)
-        params['price'] = str(params.get('price', 0))
-        params['stoploss'] = str(params.get('stoploss', ''))
-        params['disclosed_quantity'] = str(params.get('disclosed_quantity', 0))
-        params['strike_price'] = str(params.get('strike_price', ''))
+        params['quantity'] = _to_sdk_str(quantity)
+        params['price'] = _to_sdk_str(params.get('price', 0))
+        params['stoploss'] = _to_sdk_str(params.get('stoploss', ''))
+        params['disclosed_quantity'] = _to_sdk_str(params.get('disclosed_quantity', 0))
+        params['strike_price'] = _to_sdk_str(params.get('strike_price', ''))
         
         # Order confirmation if enabled
-        if self._config_manager.get('trading.confirm_orders', False):
+        if self._confirm_orders:
             if not self._confirm_order(stock, action, quantity, params):
                 self._logger.info("Order cancelled by user")
                 return {'Status': 'cancelled', 'Message': 'Order cancelled by user'}
         
         # Place order via SDK
         try:
-            self._logger.info(
-                f"Placing {action.upper()} order: {stock} x {quantity} @ "
-                f"{params['order_type']} {params['price']}"
-            )
-            
-            response = self._breeze_sdk.place_order(
+            # Lazy %-formatting defers the string build past the level
+            # check; the upper() argument is guarded too since this
+            # runs per order
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "Placing %s order: %s x %s @ %s %s",
+                    action.upper(), stock, quantity,
+                    params['order_type'], params['price'],
+                )
+            
+            # Keyword dispatch against the cached bound method: names,
+            # not positions, carry the mapping, so a reordered
+            # parameter in a future breeze-connect release fails loudly
+            # instead of silently remapping quantity/price/stoploss on
+            # a live order. (requirements.txt only pins a minimum SDK
+            # version, and the SDK's own parameter order has varied
+            # between classes.)
+            response = self._sdk_place_order(
                 stock_code=stock,
                 exchange_code=params['exchange_code'],
                 product=params['product'],
@@ -291,30 +628,114 @@ class BreezeTrader:
                 quantity=params['quantity'],
                 price=params['price'],
                 validity=params['validity'],
+                validity_date='',
                 disclosed_quantity=params['disclosed_quantity'],
                 expiry_date=params['expiry_date'],
                 right=params['right'],
                 strike_price=params['strike_price'],
-                user_remark=params.get('user_remark', ''),
-                order_type_fresh=params.get('order_type_fresh', ''),
-                order_rate_fresh=params.get('order_rate_fresh', ''),
+                user_remark=params['user_remark'],
+                order_type_fresh=params['order_type_fresh'],
+                order_rate_fresh=params['order_rate_fresh'],
             )
             
             # Log successful order
             if response and response.get('Success'):
+                self._invalidate_account_caches()
                 order_id = response['Success'].get('order_id', 'N/A')
-                self._logger.info(f"Order placed successfully: {order_id}")
+                self._logger.info("Order placed successfully: %s", order_id)
                 
                 # Show confirmation if enabled
-                if self._config_manager.get('notifications.show_order_confirmations', True):
+                if self._show_order_confirmations:
                     print(f"✓ Order placed: {order_id}")
             
             return response
             
         except Exception as e:
-            self._logger.error(f"Order placement failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("Order placement failed: %s", e)
+            raise self._sdk_error(e)
     
+    def place_order_async(
+        self,
+        stock: str,
+        action: str,
+        quantity: int,
+        **kwargs
+    ) -> concurrent.futures.Future:
+        """
+        Submit an order without blocking on the HTTP round trip.
+
+        The order is placed on a background executor (sized by
+        trading.max_inflight_orders, default 16) and a Future is
+        returned; call fut.result(timeout=...) to collect the response
+        or surface the error when convenient.
+
+        Example:
+            >>> fut = trader.place_order_async("RELIANCE", "buy", 10)
+            >>> ...  # keep working while the order is in flight
+            >>> response = fut.result(timeout=10)
+
+        Args:
+            Same as place_order()
+
+        Returns:
+            Future resolving to the order response dict
+        """
+        return self._executor.submit(
+            self.place_order, stock, action, quantity, **kwargs
+        )
+
+    def place_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place a burst of independent orders concurrently.
+
+        Orders submitted together share the pooled HTTP session and are
+        fired in parallel, so N orders cost roughly one round trip
+        instead of N sequential ones.
+
+        Example:
+            >>> trader.place_orders([
+            ...     {'stock': 'RELIANCE', 'action': 'buy', 'quantity': 10},
+            ...     {'stock': 'TCS', 'action': 'sell', 'quantity': 5,
+            ...      'order_type': 'limit', 'price': 3500},
+            ... ])
+
+        Args:
+            orders: List of dicts, each with 'stock', 'action',
+                'quantity' plus any keyword arguments place_order accepts
+
+        Returns:
+            list: Order responses in submission order. A failed order
+            contributes a dict with 'Status': 'error' and 'Error' set
+            instead of aborting the rest of the batch.
+
+        Note:
+            Pool size is configurable via trading.batching.thread_pool_size
+            in config.yaml (default: 8).
+        """
+        self._check_session()
+
+        if not orders:
+            return []
+
+        pool_size = self._batch_pool_size
+
+        def _submit(order: Dict[str, Any]) -> Dict[str, Any]:
+            params = dict(order)
+            try:
+                return self.place_order(
+                    params.pop('stock'),
+                    params.pop('action'),
+                    params.pop('quantity'),
+                    **params,
+                )
+            except BreezeTraderError as e:
+                return {'Status': 'error', 'Error': str(e)}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(pool_size, len(orders))
+        ) as executor:
+            return list(executor.map(_submit, orders))
+
     def modify_order(
         self,
         order_id: str,
@@ -358,10 +779,7 @@ class BreezeTrader:
         kwargs = resolve_parameter_aliases(kwargs)
         
         # Get exchange code (required for modification)
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
         # Convert numeric values to strings
         if 'quantity' in kwargs:
@@ -374,7 +792,7 @@ class BreezeTrader:
             kwargs['stoploss'] = str(kwargs['stoploss'])
         
         try:
-            self._logger.info(f"Modifying order: {order_id}")
+            self._logger.info("Modifying order: %s", order_id)
             
             response = self._breeze_sdk.modify_order(
                 order_id=order_id,
@@ -390,12 +808,13 @@ class BreezeTrader:
                 strike_price=kwargs.get('strike_price', ''),
             )
             
-            self._logger.info(f"Order modified successfully: {order_id}")
+            self._logger.info("Order modified successfully: %s", order_id)
+            self._invalidate_account_caches()
             return response
             
         except Exception as e:
-            self._logger.error(f"Order modification failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("Order modification failed: %s", e)
+            raise self._sdk_error(e)
     
     def cancel_order(
         self,
@@ -419,26 +838,27 @@ class BreezeTrader:
         self._check_session()
         
         if exchange_code is None:
-            exchange_code = self._config_manager.get('trading.default_exchange', 'NSE')
+            exchange_code = self._default_exchange
         
         try:
-            self._logger.info(f"Cancelling order: {order_id}")
+            self._logger.info("Cancelling order: %s", order_id)
             
             response = self._breeze_sdk.cancel_order(
                 order_id=order_id,
                 exchange_code=exchange_code
             )
             
-            self._logger.info(f"Order cancelled successfully: {order_id}")
-            
-            if self._config_manager.get('notifications.show_order_confirmations', True):
+            self._logger.info("Order cancelled successfully: %s", order_id)
+            self._invalidate_account_caches()
+
+            if self._show_order_confirmations:
                 print(f"✓ Order cancelled: {order_id}")
             
             return response
             
         except Exception as e:
-            self._logger.error(f"Order cancellation failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("Order cancellation failed: %s", e)
+            raise self._sdk_error(e)
     
     def get_order(
         self,
@@ -461,7 +881,7 @@ class BreezeTrader:
         self._check_session()
         
         if exchange_code is None:
-            exchange_code = self._config_manager.get('trading.default_exchange', 'NSE')
+            exchange_code = self._default_exchange
         
         try:
             response = self._breeze_sdk.get_order_detail(
@@ -471,7 +891,7 @@ class BreezeTrader:
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     def get_orders(
         self,
@@ -493,7 +913,7 @@ class BreezeTrader:
         self._check_session()
         
         if exchange_code is None:
-            exchange_code = self._config_manager.get('trading.default_exchange', 'NSE')
+            exchange_code = self._default_exchange
         
         try:
             response = self._breeze_sdk.get_order_list(
@@ -503,13 +923,31 @@ class BreezeTrader:
             )
             
             # Extract order list from response
-            if response and response.get('Success'):
-                return response['Success']
-            
-            return []
-            
+            return _extract_success(response)
+
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
+
+    @staticmethod
+    def _rows_to_frame(rows: List[Dict[str, Any]]):
+        """
+        Convert OHLCV rows to a typed pandas DataFrame.
+
+        Columns become float64 (OHLCV) and datetime64, so downstream
+        indicator pipelines run on NumPy arrays instead of iterating
+        a list of dicts per bar.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(rows)
+
+        if 'datetime' in df.columns:
+            df['datetime'] = pd.to_datetime(df['datetime'])
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        return df
     
     # ==================== PORTFOLIO & POSITIONS ====================
     
@@ -541,12 +979,14 @@ class BreezeTrader:
             list: List of portfolio holdings
         """
         self._check_session()
-        
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
-        
+
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
+
+        cache_key = ('portfolio', exchange_code, tuple(sorted(kwargs.items())))
+        cached = self._cache_lookup(cache_key, self._portfolio_cache_ttl_ms)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             response = self._breeze_sdk.get_portfolio_holdings(
                 exchange_code=exchange_code,
@@ -556,13 +996,13 @@ class BreezeTrader:
                 portfolio_type=kwargs.get('portfolio_type', '')
             )
             
-            if response and response.get('Success'):
-                return response['Success']
-            
-            return []
+            holdings = _extract_success(response)
+
+            self._cache_store(cache_key, holdings)
+            return holdings
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     def get_positions(self, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -580,24 +1020,26 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
-        
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
+
+        cache_key = ('positions', exchange_code, tuple(sorted(kwargs.items())))
+        cached = self._cache_lookup(cache_key, self._portfolio_cache_ttl_ms)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             response = self._breeze_sdk.get_portfolio_positions(
                 exchange_code=exchange_code,
                 product_type=kwargs.get('product_type', '')
             )
             
-            if response and response.get('Success'):
-                return response['Success']
-            
-            return []
+            positions = _extract_success(response)
+
+            self._cache_store(cache_key, positions)
+            return positions
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     def square_off(self, **kwargs) -> Dict[str, Any]:
         """
@@ -630,10 +1072,7 @@ class BreezeTrader:
         kwargs = resolve_parameter_aliases(kwargs)
         
         # Get exchange code
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
         try:
             response = self._breeze_sdk.square_off(
@@ -661,11 +1100,12 @@ class BreezeTrader:
                 order_id=kwargs.get('order_id', ''),
                 trading_symbol=kwargs.get('trading_symbol', ''),
             )
-            
+
+            self._invalidate_account_caches()
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     # ==================== MARKET DATA ====================
     
@@ -704,8 +1144,13 @@ class BreezeTrader:
         self._check_session()
         
         if exchange is None:
-            exchange = self._config_manager.get('trading.default_exchange', 'NSE')
-        
+            exchange = self._default_exchange
+
+        cache_key = ('quote', stock, exchange, tuple(sorted(kwargs.items())))
+        cached = self._cache_lookup(cache_key, self._quote_cache_ttl_ms)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             response = self._breeze_sdk.get_quotes(
                 stock_code=stock,
@@ -715,18 +1160,65 @@ class BreezeTrader:
                 right=kwargs.get('right', ''),
                 strike_price=kwargs.get('strike_price', ''),
             )
-            
+
+            self._cache_store(cache_key, response)
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
+    def get_quotes_bulk(
+        self,
+        stocks: List[str],
+        **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for several instruments with one call.
+
+        Quotes are fetched concurrently over the shared keep-alive
+        session, so a strike sweep or watchlist refresh costs roughly
+        one round trip instead of one per instrument. For a full chain
+        at a single expiry, get_option_chain() remains the cheaper
+        single-request alternative.
+
+        Example:
+            >>> quotes = trader.get_quotes_bulk(["RELIANCE", "TCS", "INFY"])
+            >>> quotes["TCS"]
+
+        Args:
+            stocks: Stock symbols to quote
+            **kwargs: Passed through to get_quote() (exchange, expiry_date,
+                product_type, right, strike_price, ...)
+
+        Returns:
+            dict: Mapping of stock symbol to its quote response. A failed
+            quote maps to a dict with 'Status': 'error' and 'Error' set.
+        """
+        self._check_session()
+
+        if not stocks:
+            return {}
+
+        exchange = kwargs.pop('exchange', None)
+
+        def _fetch(stock: str) -> Dict[str, Any]:
+            try:
+                return self.get_quote(stock, exchange, **kwargs)
+            except BreezeTraderError as e:
+                return {'Status': 'error', 'Error': str(e)}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._batch_pool_size, len(stocks))
+        ) as executor:
+            return dict(zip(stocks, executor.map(_fetch, stocks)))
+
     def get_historical_data(
         self,
         stock: str,
         interval: str = "1day",
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
+        as_frame: bool = False,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -750,6 +1242,9 @@ class BreezeTrader:
             interval: Data interval (1minute, 5minute, 30minute, 1day, etc.)
             from_date: Start date (YYYY-MM-DD)
             to_date: End date (YYYY-MM-DD)
+            as_frame: Return a typed pandas DataFrame instead of a list
+                of dicts (requires pandas; much faster for backtests
+                since indicators run vectorized instead of per-row)
             **kwargs: Additional parameters
             
         Keyword Args:
@@ -760,20 +1255,17 @@ class BreezeTrader:
             strike_price (float): Strike price
             
         Returns:
-            list: Historical OHLCV data
+            list: Historical OHLCV data (or a DataFrame if as_frame=True)
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
-        # Format dates if provided
-        if from_date:
-            from_date = from_date + "T07:00:00.000Z"
-        if to_date:
-            to_date = to_date + "T07:00:00.000Z"
+        # Format dates if provided; skip dates that already carry a time part
+        if from_date and 'T' not in from_date:
+            from_date = from_date + _DATE_SUFFIX
+        if to_date and 'T' not in to_date:
+            to_date = to_date + _DATE_SUFFIX
         
         try:
             response = self._breeze_sdk.get_historical_data_v2(
@@ -788,14 +1280,16 @@ class BreezeTrader:
                 strike_price=kwargs.get('strike_price', ''),
             )
             
-            if response and response.get('Success'):
-                return response['Success']
-            
-            return []
-            
+            rows = _extract_success(response)
+
+            if as_frame:
+                return self._rows_to_frame(rows)
+
+            return rows
+
         except Exception as e:
-            raise translate_sdk_error(e)
-    
+            raise self._sdk_error(e)
+
     def get_option_chain(self, **kwargs) -> Dict[str, Any]:
         """
         Get option chain data.
@@ -814,10 +1308,7 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NFO')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
         try:
             response = self._breeze_sdk.get_option_chain_quotes(
@@ -832,7 +1323,7 @@ class BreezeTrader:
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     # ==================== FUNDS & MARGIN ====================
     
@@ -851,20 +1342,23 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
+        cache_key = ('funds', exchange_code)
+        cached = self._cache_lookup(cache_key, self._funds_cache_ttl_ms)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             response = self._breeze_sdk.get_funds(
                 exchange_code=exchange_code
             )
-            
+
+            self._cache_store(cache_key, response)
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     def get_margin(self, **kwargs) -> Dict[str, Any]:
         """
@@ -881,21 +1375,77 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
+        cache_key = ('margin', exchange_code)
+        cached = self._cache_lookup(cache_key, self._funds_cache_ttl_ms)
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
             response = self._breeze_sdk.get_margin(
                 exchange_code=exchange_code
             )
-            
+
+            self._cache_store(cache_key, response)
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
+    # ==================== ASYNC VARIANTS ====================
+
+    def _get_order_batcher(self):
+        """Get (or lazily create) the micro-batching queue for GTT calls."""
+        if self._order_batcher is None:
+            from .batcher import OrderBatcher
+            self._order_batcher = OrderBatcher(
+                self,
+                interval_ms=self._config_manager.get(
+                    'trading.batching.interval_ms', 100),
+                max_batch_size=self._config_manager.get(
+                    'trading.batching.max_batch_size', 15),
+            )
+        return self._order_batcher
+
+    async def _run_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking SDK call in the event loop's thread pool."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
+
+    async def aget_quote(self, stock: str, exchange: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Async variant of get_quote(). See get_quote() for parameters."""
+        return await self._run_async(self.get_quote, stock, exchange, **kwargs)
+
+    async def aget_portfolio(self, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of get_portfolio(). See get_portfolio() for parameters."""
+        return await self._run_async(self.get_portfolio, **kwargs)
+
+    async def aget_positions(self, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of get_positions(). See get_positions() for parameters."""
+        return await self._run_async(self.get_positions, **kwargs)
+
+    async def aget_funds(self, **kwargs) -> Dict[str, Any]:
+        """Async variant of get_funds(). See get_funds() for parameters."""
+        return await self._run_async(self.get_funds, **kwargs)
+
+    async def aget_margin(self, **kwargs) -> Dict[str, Any]:
+        """
+        Async variant of get_margin(). See get_margin() for parameters.
+
+        Independent read calls can be overlapped so total wall time is
+        roughly the slowest round trip instead of the sum:
+
+            >>> portfolio, funds, margin = await asyncio.gather(
+            ...     trader.aget_portfolio(),
+            ...     trader.aget_funds(),
+            ...     trader.aget_margin(),
+            ... )
+        """
+        return await self._run_async(self.get_margin, **kwargs)
+
     # ==================== ACCOUNT INFO ====================
     
     def get_customer_details(self) -> Dict[str, Any]:
@@ -916,7 +1466,7 @@ class BreezeTrader:
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     # ==================== GTT ORDERS ====================
     
@@ -966,58 +1516,104 @@ class BreezeTrader:
             expiry_date (str): Expiry date for F&O
             right (str): Option type
             strike_price (str): Strike price
-            
+            batch (bool): Queue on the micro-batcher and return an
+                asyncio.Future instead of calling inline (needs a
+                running event loop)
+
         Returns:
             dict: GTT order response with gtt_order_id
         """
+        if kwargs.pop('batch', False):
+            return self._get_order_batcher().submit(self.place_gtt, stock, **kwargs)
+
         self._check_session()
-        
+
         # Resolve aliases
         kwargs = resolve_parameter_aliases(kwargs)
-        
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
-        
+
         try:
-            # Build GTT order parameters
-            gtt_params = {
-                'stock_code': stock,
-                'exchange_code': exchange_code,
-                'product': kwargs.get('product', 'cash'),
-                'action': kwargs.get('action', 'buy'),
-                'quantity': str(kwargs.get('quantity', '')),
-                'gtt_type': kwargs.get('gtt_type', 'single'),
-                'expiry_date': kwargs.get('expiry_date', ''),
-                'right': kwargs.get('right', ''),
-                'strike_price': str(kwargs.get('strike_price', '')),
-            }
-            
+            # Build GTT order parameters: template defaults with user
+            # kwargs splatted on top, then the SDK-facing whitelist
+            params = {**self._base_gtt_params, **kwargs}
+            params['stock_code'] = stock
+
+            gtt_params = {key: params[key] for key in self._GTT_PARAM_KEYS}
+            gtt_params['quantity'] = _to_sdk_str(gtt_params['quantity'])
+            gtt_params['strike_price'] = _to_sdk_str(gtt_params['strike_price'])
+
             # Handle simple single GTT vs OCO GTT
-            if kwargs.get('gtt_type') == 'cover_oco' or 'order_details' in kwargs:
-                gtt_params['order_details'] = kwargs.get('order_details', [])
+            if gtt_params['gtt_type'] == 'cover_oco' or 'order_details' in params:
+                gtt_params['order_details'] = params.get('order_details', [])
             else:
                 # Simple GTT - single trigger
-                gtt_params['trigger_price'] = str(kwargs.get('trigger_price', ''))
-                gtt_params['limit_price'] = str(kwargs.get('limit_price', ''))
-                gtt_params['order_type'] = kwargs.get('order_type', 'limit')
+                gtt_params['trigger_price'] = _to_sdk_str(params.get('trigger_price', ''))
+                gtt_params['limit_price'] = _to_sdk_str(params.get('limit_price', ''))
+                gtt_params['order_type'] = params.get('order_type', 'limit')
             
             response = self._breeze_sdk.place_gtt_order(**gtt_params)
             
             if response and response.get('Success'):
                 gtt_order_id = response['Success'].get('gtt_order_id', 'N/A')
-                self._logger.info(f"GTT order placed successfully: {gtt_order_id}")
+                self._logger.info("GTT order placed successfully: %s", gtt_order_id)
                 
-                if self._config_manager.get('notifications.show_order_confirmations', True):
+                if self._show_order_confirmations:
                     print(f"✓ GTT order placed: {gtt_order_id}")
             
             return response
             
         except Exception as e:
-            self._logger.error(f"GTT order placement failed: {e}")
-            raise translate_sdk_error(e)
-    
+            self._logger.error("GTT order placement failed: %s", e)
+            raise self._sdk_error(e)
+
+    def place_gtt_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Place a batch of GTT orders concurrently.
+
+        The Breeze API has no native multi-GTT endpoint, so each GTT
+        still costs one request, but firing them in parallel over the
+        pooled HTTP session amortizes the round trips: the batch takes
+        roughly one broker RTT instead of N sequential ones.
+
+        Example:
+            >>> trader.place_gtt_batch([
+            ...     {'stock': 'TATAMOTORS', 'quantity': 50, 'action': 'buy',
+            ...      'trigger_price': 800, 'limit_price': 805},
+            ...     {'stock': 'RELIANCE', 'quantity': 10, 'action': 'sell',
+            ...      'trigger_price': 2900, 'limit_price': 2895},
+            ... ])
+
+        Args:
+            orders: List of dicts, each with 'stock' plus any keyword
+                arguments place_gtt accepts
+
+        Returns:
+            list: GTT responses in submission order. A failed leg
+            contributes a dict with 'Status': 'error' and 'Error' set
+            instead of aborting the rest of the batch.
+
+        Note:
+            Pool size is configurable via trading.batching.thread_pool_size
+            in config.yaml (default: 8).
+        """
+        self._check_session()
+
+        if not orders:
+            return []
+
+        pool_size = self._batch_pool_size
+
+        def _submit(order: Dict[str, Any]) -> Dict[str, Any]:
+            params = dict(order)
+            try:
+                return self.place_gtt(params.pop('stock'), **params)
+            except BreezeTraderError as e:
+                return {'Status': 'error', 'Error': str(e)}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(pool_size, len(orders))
+        ) as executor:
+            return list(executor.map(_submit, orders))
+
     def get_gtt_orders(self, **kwargs) -> Dict[str, Any]:
         """
         Get GTT order book.
@@ -1033,10 +1629,7 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
         try:
             response = self._breeze_sdk.get_gtt_order_list(
@@ -1046,7 +1639,7 @@ class BreezeTrader:
             return response
             
         except Exception as e:
-            raise translate_sdk_error(e)
+            raise self._sdk_error(e)
     
     def modify_gtt(self, gtt_order_id: str, **kwargs) -> Dict[str, Any]:
         """
@@ -1066,10 +1659,7 @@ class BreezeTrader:
         """
         self._check_session()
         
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
         
         try:
             response = self._breeze_sdk.modify_gtt_order(
@@ -1079,47 +1669,103 @@ class BreezeTrader:
                 order_details=kwargs.get('order_details', [])
             )
             
-            self._logger.info(f"GTT order modified successfully: {gtt_order_id}")
+            self._logger.info("GTT order modified successfully: %s", gtt_order_id)
             return response
             
         except Exception as e:
-            self._logger.error(f"GTT order modification failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("GTT order modification failed: %s", e)
+            raise self._sdk_error(e)
     
-    def cancel_gtt(self, gtt_order_id: str, exchange_code: Optional[str] = None) -> Dict[str, Any]:
+    def cancel_gtt(
+        self,
+        gtt_order_id: str,
+        exchange_code: Optional[str] = None,
+        batch: bool = False
+    ) -> Dict[str, Any]:
         """
         Cancel a GTT order.
-        
+
         Args:
             gtt_order_id: GTT order ID to cancel
             exchange_code: Exchange code (optional)
-            
+            batch: Queue on the micro-batcher and return an
+                asyncio.Future instead of calling inline; cancels are
+                flushed ahead of placements
+
         Returns:
             dict: Cancellation response
         """
+        if batch:
+            return self._get_order_batcher().submit(
+                self.cancel_gtt, gtt_order_id, exchange_code
+            )
+
         self._check_session()
         
         if exchange_code is None:
-            exchange_code = self._config_manager.get('trading.default_exchange', 'NSE')
+            exchange_code = self._default_exchange
         
         try:
-            self._logger.info(f"Cancelling GTT order: {gtt_order_id}")
+            self._logger.info("Cancelling GTT order: %s", gtt_order_id)
             
             response = self._breeze_sdk.cancel_gtt_order(
                 gtt_order_id=gtt_order_id,
                 exchange_code=exchange_code
             )
             
-            self._logger.info(f"GTT order cancelled successfully: {gtt_order_id}")
+            self._logger.info("GTT order cancelled successfully: %s", gtt_order_id)
             
-            if self._config_manager.get('notifications.show_order_confirmations', True):
+            if self._show_order_confirmations:
                 print(f"✓ GTT order cancelled: {gtt_order_id}")
             
             return response
             
         except Exception as e:
-            self._logger.error(f"GTT order cancellation failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("GTT order cancellation failed: %s", e)
+            raise self._sdk_error(e)
+
+    def cancel_gtt_batch(
+        self,
+        gtt_order_ids: List[str],
+        exchange_code: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Cancel many GTT orders concurrently.
+
+        Cancelling a large book serially costs one round trip per
+        order; fanning out over the pooled HTTP session collapses that
+        to roughly ceil(N / pool size) round trips.
+
+        Args:
+            gtt_order_ids: GTT order IDs to cancel
+            exchange_code: Exchange code applied to every cancel (optional)
+
+        Returns:
+            list: Cancellation responses in submission order. A failed
+            cancel contributes a dict with 'Status': 'error' and
+            'Error' set instead of aborting the rest of the batch.
+
+        Note:
+            Concurrency is configurable via trading.max_concurrent_cancels
+            in config.yaml (default: 10).
+        """
+        self._check_session()
+
+        if not gtt_order_ids:
+            return []
+
+        max_workers = self._config_manager.get('trading.max_concurrent_cancels', 10)
+
+        def _submit(gtt_order_id: str) -> Dict[str, Any]:
+            try:
+                return self.cancel_gtt(gtt_order_id, exchange_code)
+            except BreezeTraderError as e:
+                return {'Status': 'error', 'Error': str(e)}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(gtt_order_ids))
+        ) as executor:
+            return list(executor.map(_submit, gtt_order_ids))
     
     # ==================== LIVE DATA STREAMING ====================
     
@@ -1161,31 +1807,123 @@ class BreezeTrader:
         Note:
             This is a blocking call. Run in a separate thread if needed.
             The callback function receives tick data as a dictionary.
+            Repeat calls only subscribe symbols not already streaming;
+            additional callbacks for a streaming symbol share the
+            existing WebSocket subscription.
         """
         self._check_session()
-        
-        exchange_code = kwargs.get(
-            'exchange_code',
-            self._config_manager.get('trading.default_exchange', 'NSE')
-        )
-        
+
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
+
         interval = kwargs.get('interval', '1second')
-        
+
+        # Diff against what is already streaming; only forward new
+        # symbols so incremental calls don't duplicate subscriptions
+        subscribed = self._subscribed_by_exchange.setdefault(exchange_code, set())
+        new_stocks = [s for s in stocks if s not in subscribed]
+
+        if new_stocks:
+            # Ticks are queued off the WS reader thread and delivered
+            # from a dedicated consumer, so slow callbacks can't back
+            # up the feed
+            if self._tick_dispatcher is None:
+                self._tick_dispatcher = _TickDispatcher(self._dispatch_tick)
+
+            try:
+                self._logger.info("Subscribing to feeds for %s stocks", len(new_stocks))
+
+                # Subscribe to live feeds
+                self._breeze_sdk.subscribe_feeds(
+                    stock_token=new_stocks,
+                    exchange_code=exchange_code,
+                    interval=interval,
+                    on_ticks=self._tick_dispatcher.push
+                )
+
+                subscribed.update(new_stocks)
+
+            except Exception as e:
+                self._logger.error("Feed subscription failed: %s", e)
+                raise self._sdk_error(e)
+
+        # Register the callback only after the symbols are actually
+        # streaming (multiple callers multiplex over the single WS
+        # subscription); a failed SDK subscribe above must not leave
+        # orphan callbacks behind
+        for stock in stocks:
+            callbacks = self._tick_callbacks.setdefault(stock, [])
+            if on_tick not in callbacks:
+                callbacks.append(on_tick)
+
+    def unsubscribe_feeds(self, stocks: List[str], **kwargs) -> None:
+        """
+        Unsubscribe from live market data feeds.
+
+        Args:
+            stocks: List of stock symbols to unsubscribe
+            **kwargs: Additional parameters
+
+        Keyword Args:
+            interval (str): Update interval ("1second", "1minute")
+            exchange_code (str): Exchange code
+
+        Note:
+            Symbols not currently subscribed are ignored.
+        """
+        self._check_session()
+
+        exchange_code = kwargs.get('exchange_code', self._default_exchange)
+
+        interval = kwargs.get('interval', '1second')
+
+        subscribed = self._subscribed_by_exchange.get(exchange_code, set())
+        to_drop = [s for s in stocks if s in subscribed]
+
+        if not to_drop:
+            return
+
         try:
-            self._logger.info(f"Subscribing to feeds for {len(stocks)} stocks")
-            
-            # Subscribe to live feeds
-            self._breeze_sdk.subscribe_feeds(
-                stock_token=stocks,
+            self._logger.info("Unsubscribing feeds for %s stocks", len(to_drop))
+
+            self._breeze_sdk.unsubscribe_feeds(
+                stock_token=to_drop,
                 exchange_code=exchange_code,
-                interval=interval,
-                on_ticks=on_tick
+                interval=interval
             )
-            
+
+            subscribed.difference_update(to_drop)
+            for stock in to_drop:
+                self._tick_callbacks.pop(stock, None)
+
         except Exception as e:
-            self._logger.error(f"Feed subscription failed: {e}")
-            raise translate_sdk_error(e)
-    
+            self._logger.error("Feed unsubscription failed: %s", e)
+            raise self._sdk_error(e)
+
+    def _dispatch_tick(self, tick: Any) -> None:
+        """
+        Route one tick to the callbacks registered for its symbol.
+
+        Ticks whose symbol can't be identified are fanned out to every
+        registered callback rather than dropped.
+        """
+        key = None
+        if isinstance(tick, dict):
+            key = tick.get('stock_code') or tick.get('symbol') or tick.get('stock_name')
+
+        callbacks = self._tick_callbacks.get(key)
+
+        if callbacks is None:
+            seen = set()
+            for registered in self._tick_callbacks.values():
+                for callback in registered:
+                    if id(callback) not in seen:
+                        seen.add(id(callback))
+                        callback(tick)
+            return
+
+        for callback in callbacks:
+            callback(tick)
+
     def subscribe_order_updates(self, on_update: Callable) -> None:
         """
         Subscribe to order update notifications (WebSocket).
@@ -1213,8 +1951,8 @@ class BreezeTrader:
             )
             
         except Exception as e:
-            self._logger.error(f"Order notification subscription failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("Order notification subscription failed: %s", e)
+            raise self._sdk_error(e)
     
     def ws_connect(self) -> None:
         """
@@ -1226,8 +1964,8 @@ class BreezeTrader:
             self._breeze_sdk.ws_connect()
             self._logger.info("WebSocket connected")
         except Exception as e:
-            self._logger.error(f"WebSocket connection failed: {e}")
-            raise translate_sdk_error(e)
+            self._logger.error("WebSocket connection failed: %s", e)
+            raise self._sdk_error(e)
     
     def ws_disconnect(self) -> None:
         """
@@ -1237,27 +1975,148 @@ class BreezeTrader:
             self._breeze_sdk.ws_disconnect()
             self._logger.info("WebSocket disconnected")
         except Exception as e:
-            self._logger.error(f"WebSocket disconnection failed: {e}")
+            self._logger.error("WebSocket disconnection failed: %s", e)
+        finally:
+            if self._tick_dispatcher is not None:
+                self._tick_dispatcher.stop()
+                self._tick_dispatcher = None
+            # Server-side subscriptions do not survive a disconnect;
+            # reset the bookkeeping so a later subscribe_feeds call
+            # re-subscribes on the fresh connection instead of seeing
+            # every symbol as already streaming
+            self._subscribed_by_exchange.clear()
+            self._tick_callbacks.clear()
     
     # ==================== UTILITY METHODS ====================
     
     def _check_session(self) -> None:
         """
         Check if session is still valid.
-        
+
+        Fast path: a single monotonic read and compare against the
+        cached check deadline; the real validation lives in
+        _check_session_slow().
+
+        Raises:
+            SessionExpiredError: If session has expired
+        """
+        if time.monotonic() >= self._session_check_valid_until:
+            self._check_session_slow()
+
+    def _check_session_slow(self) -> None:
+        """
+        Re-validate the session against the SessionManager.
+
+        A successful check is cached for up to
+        session.validity_cache_seconds (default: 300, and never past 60
+        seconds before the known expiry), so back-to-back API calls
+        don't re-read the session file each time.
+
         Raises:
             SessionExpiredError: If session has expired
         """
         if not self._session_manager.is_valid():
             raise SessionExpiredError()
-        
+
+        remaining = self._session_manager.time_until_expiry() or 0
+        self._session_check_valid_until = time.monotonic() + min(
+            max(remaining - 60, 0), self._session_check_cache_seconds
+        )
+
         # Check if session needs refresh warning
-        if self._config_manager.get('notifications.alert_on_session_expiry', True):
+        if self._alert_on_session_expiry:
             warning = self._session_manager.warn_if_expiring_soon(
-                self._config_manager.get('session.warn_before_expiry_minutes', 60)
+                self._warn_before_expiry_minutes
             )
             if warning:
                 print(warning)
+
+    def _install_header_cache(self) -> None:
+        """
+        Wrap the SDK's generate_headers with a same-second memo.
+
+        The request checksum is SHA256(timestamp + body + secret) with
+        second-granularity timestamps, so repeated calls with the same
+        body inside one second produce byte-identical headers; reusing
+        them skips the hash and header-dict rebuild on tight loops.
+        """
+        handler = getattr(self._breeze_sdk, 'api_handler', None)
+        if handler is None:
+            return
+
+        original = handler.generate_headers
+        last = {'key': None, 'headers': None}
+
+        def cached_generate_headers(body):
+            key = (int(time.time()), body)
+            if key == last['key']:
+                return last['headers']
+            headers = original(body)
+            last['key'] = key
+            last['headers'] = headers
+            return headers
+
+        handler.generate_headers = cached_generate_headers
+
+    def _cache_lookup(self, key: tuple, ttl_ms: float) -> Any:
+        """
+        Return the cached response for key if it is younger than ttl_ms,
+        else the _CACHE_MISS sentinel.
+        """
+        if ttl_ms <= 0:
+            return _CACHE_MISS
+        entry = self._response_cache.get(key)
+        if entry is not None and (time.monotonic() - entry[0]) * 1000.0 < ttl_ms:
+            # Shallow copy: callers routinely mutate a returned quote
+            # dict or holdings list, and handing out the stored object
+            # would let that corrupt every later hit within the TTL
+            return copy.copy(entry[1])
+        return _CACHE_MISS
+
+    # Purge stale cache entries once the cache grows past this many
+    # keys, so a scanner cycling thousands of quote keys doesn't grow
+    # _response_cache without bound
+    _CACHE_PURGE_THRESHOLD = 512
+
+    def _cache_store(self, key: tuple, response: Any) -> None:
+        """Cache a response under key with the current timestamp."""
+        cache = self._response_cache
+        if len(cache) >= self._CACHE_PURGE_THRESHOLD:
+            now = time.monotonic()
+            max_age = max(
+                self._quote_cache_ttl_ms,
+                self._portfolio_cache_ttl_ms,
+                self._funds_cache_ttl_ms,
+            ) / 1000.0
+            for stale_key in [
+                k for k, (ts, _) in cache.items() if now - ts >= max_age
+            ]:
+                del cache[stale_key]
+        # Store a copy as well: the miss path hands the original back
+        # to its caller, whose mutations must not reach the cache
+        cache[key] = (time.monotonic(), copy.copy(response))
+
+    def _invalidate_account_caches(self) -> None:
+        """
+        Drop cached portfolio/positions/funds/margin responses.
+
+        Called after any successful order mutation so the next read
+        reflects the trade (write-through semantics); quotes are left
+        alone since they don't depend on the account state.
+        """
+        stale = ('portfolio', 'positions', 'funds', 'margin')
+        for key in [k for k in self._response_cache if k[0] in stale]:
+            del self._response_cache[key]
+
+    def _sdk_error(self, error: Exception) -> BreezeTraderError:
+        """
+        Translate an SDK error, invalidating the cached session check
+        if the error indicates the session is no longer good.
+        """
+        translated = translate_sdk_error(error)
+        if isinstance(translated, (SessionExpiredError, AuthenticationError)):
+            self._session_check_valid_until = 0.0
+        return translated
     
     def _confirm_order(
         self,
@@ -1280,19 +2139,26 @@ class BreezeTrader:
         """
         order_type = params.get('order_type', 'market')
         price = params.get('price', '0')
-        
-        print(f"\n{'='*50}")
-        print(f"  {action.upper()} Order Confirmation")
-        print(f"{'='*50}")
-        print(f"  Stock: {stock}")
-        print(f"  Quantity: {quantity}")
-        print(f"  Order Type: {order_type}")
-        if order_type != 'market':
-            print(f"  Price: ₹{price}")
-        print(f"  Exchange: {params.get('exchange_code')}")
-        print(f"  Product: {params.get('product')}")
-        print(f"{'='*50}")
-        
+
+        rule = '=' * 50
+        price_line = f"  Price: ₹{price}\n" if order_type != 'market' else ''
+
+        # One write instead of ~10 prints (each print takes the stdout
+        # lock and issues its own syscall in line-buffered mode)
+        sys.stdout.write(
+            f"\n{rule}\n"
+            f"  {action.upper()} Order Confirmation\n"
+            f"{rule}\n"
+            f"  Stock: {stock}\n"
+            f"  Quantity: {quantity}\n"
+            f"  Order Type: {order_type}\n"
+            f"{price_line}"
+            f"  Exchange: {params.get('exchange_code')}\n"
+            f"  Product: {params.get('product')}\n"
+            f"{rule}\n"
+        )
+        sys.stdout.flush()
+
         response = input("Confirm order? (y/n): ").strip().lower()
         return response in ['y', 'yes']
     
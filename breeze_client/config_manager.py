@@ -6,14 +6,25 @@ Handles loading and validating configuration from YAML files and environment var
 
 import os
 import re
+from collections import deque
+from functools import reduce
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-from dotenv import load_dotenv
-
 from .exceptions import ConfigurationError
 
+# yaml and dotenv are imported lazily inside __init__/_load_config:
+# together they add noticeable import-time cost, and consumers that only
+# need the exceptions or session helpers never pay it.
+
+# Required config fields as (ancestor..., key) path tuples
+_REQUIRED_FIELDS = (
+    ('credentials', 'api_key'),
+    ('credentials', 'secret_key'),
+    ('trading', 'default_exchange'),
+    ('trading', 'default_product'),
+)
+
 
 class ConfigManager:
     """
@@ -45,15 +56,26 @@ class ConfigManager:
         """
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        # Resolved env vars, so a variable referenced many times costs
+        # one os.getenv lookup
+        self._env_cache: Dict[str, str] = {}
+        # (container, key, raw template) for every value that contained
+        # a ${VAR} reference; reload() re-substitutes just these
+        self._env_refs: list = []
         
         # Load environment variables from .env file if it exists
         env_file = Path('.env')
         if env_file.exists():
+            from dotenv import load_dotenv
             load_dotenv(env_file)
         
         # Load configuration
         self._load_config()
         self._validate_config()
+
+        # Precompute dot-path -> value map so get() is a single dict
+        # lookup instead of a str.split plus nested-dict walk per call
+        self._flat: Dict[str, Any] = self._flatten(self._config)
     
     def _load_config(self) -> None:
         """
@@ -62,15 +84,26 @@ class ConfigManager:
         Raises:
             ConfigurationError: If config file not found or invalid YAML
         """
-        if not self.config_path.exists():
+        import yaml
+
+        # libyaml's C scanner parses an order of magnitude faster than
+        # the pure-Python loader; fall back when PyYAML was built
+        # without it
+        try:
+            from yaml import CSafeLoader as _Loader
+        except ImportError:
+            from yaml import SafeLoader as _Loader
+
+        # Open directly instead of a separate exists() check: one
+        # syscall instead of two, and no TOCTOU window
+        try:
+            with open(self.config_path, 'r') as f:
+                self._config = yaml.load(f, Loader=_Loader) or {}
+        except FileNotFoundError:
             raise ConfigurationError(
                 f"Config file not found: {self.config_path}\n"
                 f"Please copy config.yaml.example to config.yaml and update it with your credentials."
             )
-        
-        try:
-            with open(self.config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML in config file: {self.config_path}\n{str(e)}",
@@ -97,14 +130,30 @@ class ConfigManager:
         Returns:
             Resolved value with env vars substituted
         """
-        if isinstance(obj, dict):
-            return {k: self._resolve_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._resolve_env_vars(item) for item in obj]
-        elif isinstance(obj, str):
+        if isinstance(obj, str):
             return self._substitute_env_var(obj)
-        else:
+        if not isinstance(obj, (dict, list)):
             return obj
+
+        # Iterative walk with an explicit stack (no recursion on deep
+        # YAML), substituting strings in place — the parsed config is
+        # ours, so mutation is safe
+        stack = deque([obj])
+        while stack:
+            container = stack.pop()
+            items = (
+                container.items() if isinstance(container, dict)
+                else enumerate(container)
+            )
+            for key, value in items:
+                if isinstance(value, str):
+                    if '$' in value:
+                        self._env_refs.append((container, key, value))
+                        container[key] = self._substitute_env_var(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+
+        return obj
     
     def _substitute_env_var(self, value: str) -> str:
         """
@@ -119,19 +168,29 @@ class ConfigManager:
         Raises:
             ConfigurationError: If referenced env var is not set
         """
+        # Fast path: the vast majority of config strings contain no
+        # variable reference, so skip the regex engine entirely
+        if '$' not in value:
+            return value
+
         def replacer(match):
             var_name = match.group(1)
-            env_value = os.getenv(var_name)
-            
+            env_value = self._env_cache.get(var_name)
+
             if env_value is None:
-                raise ConfigurationError(
-                    f"Environment variable '${{{var_name}}}' is not set.\n"
-                    f"Please set it in your .env file or environment.\n"
-                    f"Example: {var_name}=your_value_here"
-                )
-            
+                env_value = os.getenv(var_name)
+
+                if env_value is None:
+                    raise ConfigurationError(
+                        f"Environment variable '${{{var_name}}}' is not set.\n"
+                        f"Please set it in your .env file or environment.\n"
+                        f"Example: {var_name}=your_value_here"
+                    )
+
+                self._env_cache[var_name] = env_value
+
             return env_value
-        
+
         return self.ENV_VAR_PATTERN.sub(replacer, value)
     
     def _validate_config(self) -> None:
@@ -141,29 +200,25 @@ class ConfigManager:
         Raises:
             ConfigurationError: If required fields are missing
         """
-        required_fields = [
-            ('credentials', 'api_key'),
-            ('credentials', 'secret_key'),
-            ('trading', 'default_exchange'),
-            ('trading', 'default_product'),
-        ]
-        
         missing_fields = []
-        
-        for *path, key in required_fields:
-            current = self._config
-            field_path = '.'.join(path + [key])
-            
-            # Navigate to the nested field
-            for part in path:
-                if not isinstance(current, dict) or part not in current:
-                    missing_fields.append(field_path)
-                    break
-                current = current[part]
+        parents: Dict[tuple, Any] = {}
+
+        for *path, key in _REQUIRED_FIELDS:
+            parent_path = tuple(path)
+
+            # Walk each ancestor chain once, not once per field under it
+            if parent_path in parents:
+                parent = parents[parent_path]
             else:
-                # Check final key
-                if not isinstance(current, dict) or key not in current or not current[key]:
-                    missing_fields.append(field_path)
+                parent = reduce(
+                    lambda node, part: node.get(part) if isinstance(node, dict) else None,
+                    path,
+                    self._config,
+                )
+                parents[parent_path] = parent
+
+            if not isinstance(parent, dict) or not parent.get(key):
+                missing_fields.append('.'.join(path + [key]))
         
         if missing_fields:
             raise ConfigurationError(
@@ -172,17 +227,39 @@ class ConfigManager:
                 f"\n\nPlease update your {self.config_path} file."
             )
     
+    def _flatten(self, obj: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """
+        Flatten nested config into a dot-path keyed dict.
+
+        Intermediate dicts are included too, so both
+        get('credentials') and get('credentials.api_key') resolve.
+
+        Args:
+            obj: (Sub-)config dict to flatten
+            prefix: Dot-path prefix accumulated so far
+
+        Returns:
+            Flat dict mapping 'a.b.c' paths to values
+        """
+        flat: Dict[str, Any] = {}
+        for key, value in obj.items():
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, path + '.'))
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
-        
+
         Args:
             key: Configuration key (e.g., 'credentials.api_key')
             default: Default value if key not found
-            
+
         Returns:
             Configuration value or default
-            
+
         Examples:
             >>> config.get('credentials.api_key')
             'your_api_key'
@@ -191,16 +268,27 @@ class ConfigManager:
             >>> config.get('nonexistent.key', 'default_value')
             'default_value'
         """
-        keys = key.split('.')
-        current = self._config
-        
-        for k in keys:
-            if not isinstance(current, dict) or k not in current:
-                return default
-            current = current[k]
-        
-        return current
+        return self._flat.get(key, default)
     
+    def reload(self) -> None:
+        """
+        Re-resolve ${VAR} references against the current environment.
+
+        Only the values recorded as containing a reference at load time
+        are re-substituted — literal values skip the regex entirely —
+        so rotating a credential in the environment is picked up
+        without re-reading or re-parsing the YAML file.
+
+        Raises:
+            ConfigurationError: If a referenced env var is no longer set
+        """
+        self._env_cache.clear()
+
+        for container, key, template in self._env_refs:
+            container[key] = self._substitute_env_var(template)
+
+        self._flat = self._flatten(self._config)
+
     def get_credentials(self) -> Dict[str, str]:
         """
         Get API credentials.
@@ -245,7 +333,18 @@ class ConfigManager:
         if key not in self._config:
             raise KeyError(f"Config key not found: {key}")
         return self._config[key]
-    
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        Set a top-level config key and rebuild the flattened lookup map.
+
+        Args:
+            key: Top-level config key
+            value: New value (may be a nested dict)
+        """
+        self._config[key] = value
+        self._flat = self._flatten(self._config)
+
     def __repr__(self) -> str:
         """String representation of ConfigManager."""
         return f"ConfigManager(config_path='{self.config_path}')"
@@ -4,10 +4,77 @@ Breeze Trading Client - Custom Exceptions
 User-friendly exceptions that translate technical errors into plain English.
 """
 
+import re
+
+# Single source of truth for the exception names re-exported by the package
+__all__ = [
+    "BreezeTraderError",
+    "ConfigurationError",
+    "SessionExpiredError",
+    "SessionNotFoundError",
+    "OrderValidationError",
+    "InsufficientFundsError",
+    "MarketClosedError",
+    "RateLimitError",
+    "AuthenticationError",
+    "InvalidStockCodeError",
+    "OrderNotFoundError",
+    "NetworkError",
+    "WebSocketError",
+]
+
+
+# Default long-form messages built once at import; error-heavy paths
+# (rate-limit bursts, retry loops) then reference them instead of
+# re-interpolating multi-line strings per raise
+_DEFAULT_SESSION_EXPIRED = (
+    "❌ Session expired! Please run: python scripts/login.py\n"
+    "Session tokens are valid for 24 hours or until midnight."
+)
+
+_DEFAULT_SESSION_NOT_FOUND = (
+    "❌ No active session found! Please run: python scripts/login.py\n"
+    "You need to login once per day to generate a session token."
+)
+
+_DEFAULT_INSUFFICIENT_FUNDS = (
+    "❌ Insufficient funds for this order. Please check your account balance."
+)
+
+_DEFAULT_MARKET_CLOSED = (
+    "❌ Market is closed. Trading hours:\n"
+    "  Equity: 9:15 AM - 3:30 PM (Mon-Fri)\n"
+    "  F&O: 9:15 AM - 3:30 PM (Mon-Fri)"
+)
+
+_DEFAULT_RATE_LIMIT = (
+    "❌ API rate limit exceeded!\n"
+    "Limits: 100 calls/minute, 5000 calls/day\n"
+    "Please wait a moment before trying again."
+)
+
+_DEFAULT_AUTHENTICATION = (
+    "❌ Authentication failed! Please check:\n"
+    "  1. API key and secret key are correct in config.yaml\n"
+    "  2. Session token is valid (run: python scripts/login.py)\n"
+    "  3. Your Breeze API account is active"
+)
+
+_DEFAULT_NETWORK = (
+    "❌ Network error! Please check:\n"
+    "  1. Your internet connection\n"
+    "  2. ICICI Direct API status\n"
+    "  3. Firewall/proxy settings"
+)
+
 
 class BreezeTraderError(Exception):
     """Base exception for all Breeze Trading Client errors."""
-    
+
+    # Prepended to custom messages; stored once per class so __init__
+    # avoids re-encoding the emoji in an f-string on every raise
+    _PREFIX = "❌ "
+
     def __init__(self, message: str, original_error: Exception = None):
         """
         Initialize exception with message and optional original error.
@@ -26,169 +93,159 @@ class BreezeTraderError(Exception):
 
 class ConfigurationError(BreezeTraderError):
     """Configuration file or environment variable issues."""
-    
+
+    _PREFIX = "❌ Configuration Error: "
+
     def __init__(self, message: str, original_error: Exception = None):
-        super().__init__(f"❌ Configuration Error: {message}", original_error)
+        super().__init__(self._PREFIX + message, original_error)
 
 
 class SessionExpiredError(BreezeTraderError):
     """Session token has expired."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = (
-                "Session expired! Please run: python scripts/login.py\n"
-                "Session tokens are valid for 24 hours or until midnight."
-            )
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_SESSION_EXPIRED)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class SessionNotFoundError(BreezeTraderError):
     """Session token file not found."""
-    
+
     def __init__(self):
-        message = (
-            "No active session found! Please run: python scripts/login.py\n"
-            "You need to login once per day to generate a session token."
-        )
-        super().__init__(f"❌ {message}")
+        super().__init__(_DEFAULT_SESSION_NOT_FOUND)
 
 
 class OrderValidationError(BreezeTraderError):
     """Order parameter validation failed."""
-    
+
+    _PREFIX = "❌ Order Validation Error: "
+
     def __init__(self, message: str):
-        super().__init__(f"❌ Order Validation Error: {message}")
+        super().__init__(self._PREFIX + message)
 
 
 class InsufficientFundsError(BreezeTraderError):
     """Not enough funds to place the order."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = "Insufficient funds for this order. Please check your account balance."
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_INSUFFICIENT_FUNDS)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class MarketClosedError(BreezeTraderError):
     """Market is currently closed."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = (
-                "Market is closed. Trading hours:\n"
-                "  Equity: 9:15 AM - 3:30 PM (Mon-Fri)\n"
-                "  F&O: 9:15 AM - 3:30 PM (Mon-Fri)"
-            )
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_MARKET_CLOSED)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class RateLimitError(BreezeTraderError):
     """API rate limit exceeded."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = (
-                "API rate limit exceeded!\n"
-                "Limits: 100 calls/minute, 5000 calls/day\n"
-                "Please wait a moment before trying again."
-            )
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_RATE_LIMIT)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class AuthenticationError(BreezeTraderError):
     """Authentication with API failed."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = (
-                "Authentication failed! Please check:\n"
-                "  1. API key and secret key are correct in config.yaml\n"
-                "  2. Session token is valid (run: python scripts/login.py)\n"
-                "  3. Your Breeze API account is active"
-            )
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_AUTHENTICATION)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class InvalidStockCodeError(BreezeTraderError):
     """Invalid or unknown stock code."""
-    
+
     def __init__(self, stock_code: str, suggestion: str = None):
-        message = f"Invalid stock code: '{stock_code}'"
+        message = f"{self._PREFIX}Invalid stock code: '{stock_code}'"
         if suggestion:
             message += f"\nDid you mean '{suggestion}'?"
-        super().__init__(f"❌ {message}")
+        super().__init__(message)
 
 
 class OrderNotFoundError(BreezeTraderError):
     """Order ID not found."""
-    
+
     def __init__(self, order_id: str):
-        message = f"Order not found: {order_id}"
-        super().__init__(f"❌ {message}")
+        super().__init__(f"{self._PREFIX}Order not found: {order_id}")
 
 
 class NetworkError(BreezeTraderError):
     """Network connectivity issues."""
-    
+
     def __init__(self, message: str = None):
         if message is None:
-            message = (
-                "Network error! Please check:\n"
-                "  1. Your internet connection\n"
-                "  2. ICICI Direct API status\n"
-                "  3. Firewall/proxy settings"
-            )
-        super().__init__(f"❌ {message}")
+            super().__init__(_DEFAULT_NETWORK)
+        else:
+            super().__init__(self._PREFIX + message)
 
 
 class WebSocketError(BreezeTraderError):
     """WebSocket connection issues."""
-    
+
+    _PREFIX = "❌ WebSocket Error: "
+
     def __init__(self, message: str):
-        super().__init__(f"❌ WebSocket Error: {message}")
+        super().__init__(self._PREFIX + message)
+
+
+# One compiled pattern per category, tried in the original check
+# priority order (session outranks auth, network comes last). A single
+# big alternation cannot express that priority: re.search returns the
+# leftmost match in the *message*, so "Connection failed: session
+# expired" would come back as a network error and BreezeTrader would
+# never reset its cached session verdict. Each phrase list still scans
+# the message once at C speed; there are just eight short scans in the
+# worst (unrecognized) case instead of one.
+_SDK_ERROR_RULES = (
+    (re.compile(r'invalid session|session|token|expired', re.IGNORECASE).search,
+     lambda error: SessionExpiredError()),
+    (re.compile(r'authentication|unauthorized|invalid credentials', re.IGNORECASE).search,
+     lambda error: AuthenticationError()),
+    (re.compile(r'insufficient (?:funds|balance)', re.IGNORECASE).search,
+     lambda error: InsufficientFundsError()),
+    (re.compile(r'market (?:is )?closed', re.IGNORECASE).search,
+     lambda error: MarketClosedError()),
+    (re.compile(r'invalid (?:stock|symbol)', re.IGNORECASE).search,
+     lambda error: InvalidStockCodeError("Unknown")),
+    (re.compile(r'order not found', re.IGNORECASE).search,
+     lambda error: OrderNotFoundError("Unknown")),
+    (re.compile(r'rate limit|too many requests', re.IGNORECASE).search,
+     lambda error: RateLimitError()),
+    (re.compile(r'connection|timeout|network', re.IGNORECASE).search,
+     lambda error: NetworkError(str(error))),
+)
 
 
 def translate_sdk_error(error: Exception) -> BreezeTraderError:
     """
     Translate SDK errors into user-friendly exceptions.
-    
+
     Args:
         error: Original SDK exception
-        
+
     Returns:
         BreezeTraderError: Translated exception
     """
-    error_msg = str(error).lower()
-    
-    # Session/Authentication errors
-    if any(x in error_msg for x in ['session', 'token', 'expired', 'invalid session']):
-        return SessionExpiredError()
-    
-    if any(x in error_msg for x in ['authentication', 'unauthorized', 'invalid credentials']):
-        return AuthenticationError()
-    
-    # Order-related errors
-    if 'insufficient funds' in error_msg or 'insufficient balance' in error_msg:
-        return InsufficientFundsError()
-    
-    if 'market closed' in error_msg or 'market is closed' in error_msg:
-        return MarketClosedError()
-    
-    if 'invalid stock' in error_msg or 'invalid symbol' in error_msg:
-        return InvalidStockCodeError("Unknown")
-    
-    if 'order not found' in error_msg:
-        return OrderNotFoundError("Unknown")
-    
-    # Rate limiting
-    if 'rate limit' in error_msg or 'too many requests' in error_msg:
-        return RateLimitError()
-    
-    # Network errors
-    if any(x in error_msg for x in ['connection', 'timeout', 'network']):
-        return NetworkError(str(error))
-    
+    message = str(error)
+
+    for search, factory in _SDK_ERROR_RULES:
+        if search(message):
+            return factory(error)
+
     # Default: wrap in base exception
-    return BreezeTraderError(f"API Error: {str(error)}", error)
+    return BreezeTraderError(f"API Error: {message}", error)
 
@@ -4,13 +4,35 @@ Breeze Trading Client - Session Manager
 Handles session token persistence and validation.
 """
 
+import calendar
+import functools
 import os
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Tuple
 
 from .exceptions import SessionExpiredError, SessionNotFoundError
 
+# Process-wide instance cache for SessionManager.get(): concurrent
+# strategies sharing a session file reuse one manager (and its cached
+# validity verdict) instead of each re-reading the file on startup
+_INSTANCES: dict = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=128)
+def _expiry_warning(hours: int, minutes: int) -> str:
+    """Build the expiring-soon warning; cached per minute bucket so a
+    1 Hz dashboard poll formats the message once per minute, not once
+    per call."""
+    time_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+    return (
+        f"⚠️  Session expires in {time_str}\n"
+        f"Run 'python scripts/login.py' to refresh your session."
+    )
+
 
 class SessionManager:
     """
@@ -24,33 +46,76 @@ class SessionManager:
     - Secure file permissions (read/write for owner only)
     
     Session File Format:
-        <session_token>|<expiry_timestamp_iso8601>
-        
+        <session_token>|<expiry_epoch_seconds>
+
     Example:
-        58593|2025-10-26T00:00:00Z
+        58593|1761436799
+
+    The legacy ISO-8601 expiry format (58593|2025-10-26T00:00:00Z) is
+    still read transparently.
     """
     
     SESSION_FILE = '.session_token'
-    
+
+    # How long an is_valid() verdict is trusted before re-checking;
+    # session expiry moves on a minute scale, so 1s is conservative
+    VALIDITY_CACHE_SECONDS = 1.0
+
     def __init__(self, session_file: str = SESSION_FILE):
         """
         Initialize SessionManager.
-        
+
         Args:
             session_file: Path to session token file (default: .session_token)
         """
         self.session_file = Path(session_file)
+        # Serializes disk reloads so two threads hitting an expired
+        # cache don't both re-read the file (re-entrant: save/clear
+        # call back into clearing paths)
+        self._lock = threading.RLock()
         self._session_token: Optional[str] = None
         self._expiry: Optional[datetime] = None
+        # Expiry as a plain epoch float: validity becomes one time.time()
+        # compare instead of two datetime allocations per check
+        self._expiry_epoch: Optional[float] = None
+        # Sticky record of a load that found the token expired: the
+        # file is deleted on that path, and without this a later load
+        # would degrade the verdict to "not found"
+        self._expired_epoch: Optional[float] = None
+        # Short-TTL cache of the last is_valid() verdict
+        self._last_check_monotonic: float = float('-inf')
+        self._last_valid: bool = False
         
         # Load existing session if available
-        if self.session_file.exists():
-            try:
-                self._load_session()
-            except (SessionExpiredError, SessionNotFoundError):
-                # Silently ignore if session is expired or invalid
-                pass
-    
+        try:
+            self._load_session()
+        except (SessionExpiredError, SessionNotFoundError):
+            # Silently ignore if session is missing, expired or invalid
+            pass
+
+    @classmethod
+    def get(cls, session_file: str = SESSION_FILE) -> 'SessionManager':
+        """
+        Get a shared SessionManager for the given session file.
+
+        Repeated calls with the same path return one cached instance,
+        so multi-threaded setups (websocket + REST, per-stock workers)
+        don't each load and validate the session file separately.
+
+        Args:
+            session_file: Path to session token file (default: .session_token)
+
+        Returns:
+            The process-wide SessionManager for that path
+        """
+        key = Path(session_file)
+        with _INSTANCES_LOCK:
+            manager = _INSTANCES.get(key)
+            if manager is None:
+                manager = cls(session_file)
+                _INSTANCES[key] = manager
+            return manager
+
     def save_session(self, session_token: str, expiry: Optional[datetime] = None) -> None:
         """
         Save session token to file with expiry time.
@@ -64,71 +129,130 @@ class SessionManager:
             whichever comes first.
         """
         if expiry is None:
-            # Default: midnight today UTC
-            now = datetime.now(timezone.utc)
-            expiry = datetime(now.year, now.month, now.day, 23, 59, 59, tzinfo=timezone.utc)
-        
-        # Ensure expiry has timezone info
-        if expiry.tzinfo is None:
-            expiry = expiry.replace(tzinfo=timezone.utc)
-        
-        # Save to file
-        content = f"{session_token}|{expiry.isoformat()}\n"
-        
+            # Default: end of today UTC. calendar.timegm is pure integer
+            # arithmetic — no datetime or tzinfo objects are built; a
+            # datetime only materializes if get_expiry_time() is called.
+            # time.gmtime() (not date.today()) supplies the fields:
+            # timegm treats them as UTC, and the local date is already
+            # tomorrow during IST evenings, which would push the expiry
+            # a full day out.
+            now = time.gmtime()
+            expiry_epoch = calendar.timegm(
+                (now.tm_year, now.tm_mon, now.tm_mday, 23, 59, 59, 0, 0, 0)
+            )
+        else:
+            # Ensure expiry has timezone info
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+            expiry_epoch = expiry.timestamp()
+
+        # Save to file (epoch seconds: loading skips datetime parsing)
+        content = f"{session_token}|{int(expiry_epoch)}\n"
+
         try:
-            # Write to file
-            self.session_file.write_text(content)
-            
-            # Set secure file permissions (owner read/write only)
-            # 0o600 = -rw------- (owner can read/write, others have no access)
-            os.chmod(self.session_file, 0o600)
-            
-            # Update in-memory cache
-            self._session_token = session_token
-            self._expiry = expiry
-            
+            with self._lock:
+                # Write to a temp file and rename into place: os.replace
+                # is atomic on POSIX and Windows, so a crash mid-write
+                # can never leave a half-written token that would force
+                # a re-login. Raw byte write (one short line) with the
+                # secure permissions (0o600, owner read/write only)
+                # fused into open() instead of a separate chmod syscall.
+                tmp_file = self.session_file.with_suffix(
+                    self.session_file.suffix + '.tmp'
+                )
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    os.write(fd, content.encode('utf-8'))
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_file, self.session_file)
+
+                # Update in-memory cache (expiry is None on the default
+                # path; get_expiry_time materializes it on demand)
+                self._session_token = session_token
+                self._expiry = expiry
+                self._expiry_epoch = float(expiry_epoch)
+                self._expired_epoch = None
+                self._last_check_monotonic = float('-inf')
+
         except Exception as e:
             raise IOError(f"Failed to save session token: {e}")
     
+    @staticmethod
+    def _expired_error(expiry_epoch: float) -> SessionExpiredError:
+        """Build the expired-session error for a known expiry epoch."""
+        expired_at = datetime.fromtimestamp(expiry_epoch, timezone.utc)
+        return SessionExpiredError(
+            f"Session expired at {expired_at.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
+            "Please run: python scripts/login.py"
+        )
+
     def _load_session(self) -> None:
         """
         Load session token from file.
-        
+
         Raises:
             SessionNotFoundError: If session file doesn't exist
             SessionExpiredError: If session has expired
         """
-        if not self.session_file.exists():
+        # One reload at a time: concurrent callers that both see a
+        # stale cache wait here rather than both hitting the disk
+        with self._lock:
+            self._load_session_locked()
+
+    def _load_session_locked(self) -> None:
+        """Read and parse the session file; caller holds self._lock."""
+        # Read directly and let the error path classify: one syscall
+        # instead of a stat() followed by open(), and raw bytes instead
+        # of a TextIOWrapper for the ~50-byte payload
+        try:
+            fd = os.open(self.session_file, os.O_RDONLY)
+        except FileNotFoundError:
+            if self._expired_epoch is not None:
+                # The file is gone because an earlier load saw it
+                # expired and cleared it; keep reporting "expired"
+                raise self._expired_error(self._expired_epoch)
             raise SessionNotFoundError()
-        
+
+        try:
+            content = os.read(fd, 256).decode('utf-8').strip()
+        finally:
+            os.close(fd)
+
         try:
-            content = self.session_file.read_text().strip()
-            
             if '|' not in content:
                 # Old format or corrupted file
                 self.clear_session()
                 raise SessionNotFoundError()
             
             token, expiry_str = content.split('|', 1)
-            expiry = datetime.fromisoformat(expiry_str)
-            
-            # Ensure timezone awareness
-            if expiry.tzinfo is None:
-                expiry = expiry.replace(tzinfo=timezone.utc)
-            
-            # Check if expired
-            now = datetime.now(timezone.utc)
-            if now >= expiry:
+
+            if 'T' in expiry_str:
+                # Legacy ISO-8601 format
+                expiry = datetime.fromisoformat(expiry_str)
+                if expiry.tzinfo is None:
+                    expiry = expiry.replace(tzinfo=timezone.utc)
+                expiry_epoch = expiry.timestamp()
+            else:
+                # Epoch format: no datetime construction on the load path
+                expiry = None
+                expiry_epoch = float(expiry_str)
+
+            # Check if expired (after clear_session, which resets the
+            # sticky verdict, so the order matters)
+            if time.time() >= expiry_epoch:
                 self.clear_session()
-                raise SessionExpiredError(
-                    f"Session expired at {expiry.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
-                    "Please run: python scripts/login.py"
-                )
-            
-            # Update in-memory cache
+                self._expired_epoch = expiry_epoch
+                raise self._expired_error(expiry_epoch)
+
+            # Update in-memory cache (datetime materialized lazily by
+            # get_expiry_time when the file held an epoch)
             self._session_token = token
             self._expiry = expiry
-            
+            self._expiry_epoch = expiry_epoch
+            self._last_check_monotonic = float('-inf')
+
         except (ValueError, OSError) as e:
             # Corrupted session file
             self.clear_session()
@@ -146,7 +270,7 @@ class SessionManager:
             SessionExpiredError: If session has expired
         """
         self._load_session()
-        return self._session_token, self._expiry
+        return self._session_token, self.get_expiry_time()
     
     def get_session_token(self) -> str:
         """
@@ -175,17 +299,24 @@ class SessionManager:
         Returns:
             True if session is valid, False otherwise
         """
-        if self._session_token is None or self._expiry is None:
-            if not self.session_file.exists():
-                return False
+        # Trust the last verdict within the cache window so hot order
+        # loops don't re-read the clock (or the session file) per call
+        now_mono = time.monotonic()
+        if now_mono - self._last_check_monotonic < self.VALIDITY_CACHE_SECONDS:
+            return self._last_valid
+
+        if self._session_token is None or self._expiry_epoch is None:
             try:
                 self._load_session()
             except (SessionExpiredError, SessionNotFoundError):
                 return False
-        
-        # Check expiry
-        now = datetime.now(timezone.utc)
-        return now < self._expiry
+
+        # Check expiry (epoch compare; no datetime allocations)
+        valid = time.time() < self._expiry_epoch
+
+        self._last_check_monotonic = now_mono
+        self._last_valid = valid
+        return valid
     
     def time_until_expiry(self) -> Optional[float]:
         """
@@ -196,9 +327,8 @@ class SessionManager:
         """
         if not self.is_valid():
             return None
-        
-        now = datetime.now(timezone.utc)
-        remaining = (self._expiry - now).total_seconds()
+
+        remaining = self._expiry_epoch - time.time()
         return max(0, remaining)
     
     def get_expiry_time(self) -> Optional[datetime]:
@@ -208,23 +338,31 @@ class SessionManager:
         Returns:
             Expiry datetime or None if no session
         """
-        if self._expiry is None and self.session_file.exists():
+        if self._expiry_epoch is None:
             try:
                 self._load_session()
             except (SessionExpiredError, SessionNotFoundError):
                 return None
-        
+
+        # Materialize the datetime on demand; validity checks only
+        # ever touch the epoch float
+        if self._expiry is None and self._expiry_epoch is not None:
+            self._expiry = datetime.fromtimestamp(self._expiry_epoch, timezone.utc)
+
         return self._expiry
     
     def clear_session(self) -> None:
         """
         Delete session file and clear cached session.
         """
-        if self.session_file.exists():
-            self.session_file.unlink()
-        
-        self._session_token = None
-        self._expiry = None
+        with self._lock:
+            self.session_file.unlink(missing_ok=True)
+
+            self._session_token = None
+            self._expiry = None
+            self._expiry_epoch = None
+            self._expired_epoch = None
+            self._last_check_monotonic = float('-inf')
     
     def warn_if_expiring_soon(self, warning_minutes: int = 60) -> Optional[str]:
         """
@@ -246,14 +384,9 @@ class SessionManager:
         if remaining_minutes < warning_minutes:
             hours = int(remaining_minutes // 60)
             minutes = int(remaining_minutes % 60)
-            
-            time_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-            
-            return (
-                f"⚠️  Session expires in {time_str}\n"
-                f"Run 'python scripts/login.py' to refresh your session."
-            )
-        
+
+            return _expiry_warning(hours, minutes)
+
         return None
     
     def __repr__(self) -> str:
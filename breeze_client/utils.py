@@ -4,14 +4,18 @@ Breeze Trading Client - Utility Functions
 Helper functions for parameter handling, logging, validation, etc.
 """
 
+import functools
 import logging
-from datetime import datetime
+import string
+import sys
+from datetime import datetime, time
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 
 # Parameter aliases mapping
 # Maps trader-friendly names to SDK parameter names
-PARAMETER_ALIASES = {
+_RAW_PARAMETER_ALIASES = {
     # Order parameters
     'type': 'order_type',
     'exchange': 'exchange_code',
@@ -34,6 +38,61 @@ PARAMETER_ALIASES = {
     'limit': 'limit_price',
 }
 
+# Interned keys/values mean alias lookups hit identity-equal strings
+# (no character compare after the hash), and the read-only proxy
+# guards the shared table against accidental mutation
+PARAMETER_ALIASES = MappingProxyType({
+    sys.intern(alias): sys.intern(name)
+    for alias, name in _RAW_PARAMETER_ALIASES.items()
+})
+
+# Bound at module scope so resolve_parameter_aliases avoids per-call
+# attribute lookups; the frozenset gives a C-level disjointness test
+_ALIAS_GET = PARAMETER_ALIASES.get
+_ALIAS_KEYS = frozenset(PARAMETER_ALIASES)
+
+# Deletion table for stock-code validation: translating away every
+# allowed character must leave an empty string
+_STOCK_CODE_DELETE_TBL = str.maketrans(
+    '', '', string.ascii_uppercase + string.digits + '&-'
+)
+
+# Market hours per exchange, with time objects precomputed so
+# is_market_open never pays a strptime per call
+_MARKET_HOURS = {
+    'NSE': {'open': '09:15', 'close': '15:30'},
+    'BSE': {'open': '09:15', 'close': '15:30'},
+    'NFO': {'open': '09:15', 'close': '15:30'},
+    'MCX': {'open': '09:00', 'close': '23:30'},
+    'NDX': {'open': '09:00', 'close': '17:00'},
+}
+
+_DEFAULT_MARKET_HOURS = {'open': '09:15', 'close': '15:30'}
+
+
+def _parse_hhmm(value: str) -> time:
+    """Parse an 'HH:MM' string into a time object."""
+    hours, minutes = value.split(':')
+    return time(int(hours), int(minutes))
+
+
+_MARKET_HOURS_TIMES = {
+    exchange: (_parse_hhmm(hours['open']), _parse_hhmm(hours['close']))
+    for exchange, hours in _MARKET_HOURS.items()
+}
+
+_DEFAULT_MARKET_TIMES = (
+    _parse_hhmm(_DEFAULT_MARKET_HOURS['open']),
+    _parse_hhmm(_DEFAULT_MARKET_HOURS['close']),
+)
+
+# From 3.11, datetime.fromisoformat accepts fractional seconds and a
+# trailing 'Z' directly, so no sanitization pass is needed
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Shared suffix for truncate_string: built once, interned
+_ELLIPSIS = sys.intern('...')
+
 
 def resolve_parameter_aliases(kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -52,14 +111,13 @@ def resolve_parameter_aliases(kwargs: Dict[str, Any]) -> Dict[str, Any]:
         >>> resolve_parameter_aliases({'type': 'limit', 'qty': 10})
         {'order_type': 'limit', 'quantity': 10}
     """
-    resolved = {}
-    
-    for key, value in kwargs.items():
-        # Use alias if it exists, otherwise keep original key
-        resolved_key = PARAMETER_ALIASES.get(key, key)
-        resolved[resolved_key] = value
-    
-    return resolved
+    # Fast path: most calls already use canonical names, so skip the
+    # rebuild entirely when no alias key is present
+    if _ALIAS_KEYS.isdisjoint(kwargs):
+        return kwargs
+
+    get = _ALIAS_GET
+    return {get(key, key): value for key, value in kwargs.items()}
 
 
 def setup_logging(
@@ -82,32 +140,35 @@ def setup_logging(
     """
     if log_format is None:
         log_format = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
-    
+
     if date_format is None:
         date_format = '%Y-%m-%d %H:%M:%S'
-    
+
+    # Resolve the level once; Formatter objects are reusable across
+    # handlers, so one instance serves both
+    log_level = getattr(logging, level.upper())
+    formatter = logging.Formatter(log_format, date_format)
+
     # Get or create logger
     logger = logging.getLogger('breeze_client')
-    logger.setLevel(getattr(logging, level.upper()))
-    
+    logger.setLevel(log_level)
+
     # Remove existing handlers
     logger.handlers.clear()
-    
+
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, level.upper()))
-    console_formatter = logging.Formatter(log_format, date_format)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
-    
+
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_formatter = logging.Formatter(log_format, date_format)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
-    
+
     return logger
 
 
@@ -165,14 +226,16 @@ def validate_stock_code(stock_code: str) -> bool:
     
     # Basic checks: alphanumeric, reasonable length
     stock_code = stock_code.strip().upper()
-    
+
     if len(stock_code) < 1 or len(stock_code) > 20:
         return False
-    
-    # Allow letters, numbers, and some special chars (&, -)
-    if not all(c.isalnum() or c in '&-' for c in stock_code):
+
+    # Allow letters, numbers, and some special chars (&, -): deleting
+    # every allowed character must consume the whole string (single
+    # C-level pass instead of a per-character Python loop)
+    if stock_code.translate(_STOCK_CODE_DELETE_TBL):
         return False
-    
+
     return True
 
 
@@ -186,16 +249,10 @@ def validate_quantity(quantity: int) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not isinstance(quantity, int):
-        return False
-    
-    if quantity <= 0:
-        return False
-    
-    if quantity > 1000000:  # Reasonable upper limit
-        return False
-    
-    return True
+    # type() identity compare is a single pointer test — cheaper than
+    # isinstance on this per-order hot path — and the chained compare
+    # folds the range check into one expression (1,000,000 upper limit)
+    return type(quantity) is int and 0 < quantity <= 1000000
 
 
 def validate_price(price: float, allow_zero: bool = True) -> bool:
@@ -209,19 +266,16 @@ def validate_price(price: float, allow_zero: bool = True) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not isinstance(price, (int, float)):
-        return False
-    
-    if not allow_zero and price <= 0:
+    # Same pointer-compare trick as validate_quantity: two identity
+    # tests instead of an isinstance tuple walk
+    kind = type(price)
+    if kind is not int and kind is not float:
         return False
-    
-    if allow_zero and price < 0:
-        return False
-    
+
     if price > 1000000:  # Reasonable upper limit
         return False
-    
-    return True
+
+    return price >= 0 if allow_zero else price > 0
 
 
 def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
@@ -238,6 +292,16 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
         >>> merge_dicts({'a': 1}, {'b': 2}, {'a': 3})
         {'a': 3, 'b': 2}
     """
+    # Specialize the common 2- and 3-arg calls: PEP 448 unpacking
+    # builds the merged dict in one C-level operation, skipping the
+    # Python loop of update() calls
+    if len(dicts) == 2:
+        a, b = dicts
+        return {**(a or {}), **(b or {})}
+    if len(dicts) == 3:
+        a, b, c = dicts
+        return {**(a or {}), **(b or {}), **(c or {})}
+
     result = {}
     for d in dicts:
         if d:
@@ -245,18 +309,26 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+@functools.lru_cache(maxsize=2048)
+def _strftime_cached(dt: datetime, format_str: str) -> str:
+    """Memoized strftime; repeated (dt, fmt) pairs skip the format walk."""
+    return dt.strftime(format_str)
+
+
 def format_datetime(dt: datetime, format_str: str = '%Y-%m-%d %H:%M:%S') -> str:
     """
     Format datetime object to string.
-    
+
     Args:
         dt: Datetime object
         format_str: Format string
-        
+
     Returns:
         Formatted datetime string
     """
-    return dt.strftime(format_str)
+    # Order books and second-resolution logs format the same instant
+    # many times over; the cache turns those repeats into a dict hit
+    return _strftime_cached(dt, format_str)
 
 
 def parse_iso_datetime(dt_str: str) -> datetime:
@@ -273,10 +345,15 @@ def parse_iso_datetime(dt_str: str) -> datetime:
         >>> parse_iso_datetime('2025-10-25T09:15:00.000Z')
         datetime.datetime(2025, 10, 25, 9, 15, tzinfo=timezone.utc)
     """
-    # Remove milliseconds if present
-    if '.' in dt_str:
-        dt_str = dt_str.split('.')[0] + 'Z'
-    
+    if _FROMISO_HANDLES_Z:
+        return datetime.fromisoformat(dt_str)
+
+    # Pre-3.11 fallback: drop fractional seconds via partition (one C
+    # call, no list) and map the trailing 'Z' to an explicit offset
+    head, sep, _ = dt_str.partition('.')
+    if sep:
+        return datetime.fromisoformat(head + '+00:00')
+
     return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
 
 
@@ -290,15 +367,12 @@ def clean_response_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Cleaned response data
     """
-    # Remove None values
-    cleaned = {k: v for k, v in data.items() if v is not None}
-    
-    # Convert empty strings to None
-    for key, value in cleaned.items():
-        if value == '':
-            cleaned[key] = None
-    
-    return cleaned
+    # Drop None values and normalize empty strings in a single pass
+    return {
+        key: (None if value == '' else value)
+        for key, value in data.items()
+        if value is not None
+    }
 
 
 def get_market_hours(exchange: str = 'NSE') -> Dict[str, str]:
@@ -311,15 +385,9 @@ def get_market_hours(exchange: str = 'NSE') -> Dict[str, str]:
     Returns:
         Dictionary with 'open' and 'close' times
     """
-    market_hours = {
-        'NSE': {'open': '09:15', 'close': '15:30'},
-        'BSE': {'open': '09:15', 'close': '15:30'},
-        'NFO': {'open': '09:15', 'close': '15:30'},
-        'MCX': {'open': '09:00', 'close': '23:30'},
-        'NDX': {'open': '09:00', 'close': '17:00'},
-    }
-    
-    return market_hours.get(exchange.upper(), {'open': '09:15', 'close': '15:30'})
+    # Copy so callers mutating the result can't corrupt the shared
+    # hours table (is_market_open's precomputed times live off it)
+    return dict(_MARKET_HOURS.get(exchange.upper(), _DEFAULT_MARKET_HOURS))
 
 
 def is_market_open(exchange: str = 'NSE') -> bool:
@@ -335,19 +403,17 @@ def is_market_open(exchange: str = 'NSE') -> bool:
         True if market should be open, False otherwise
     """
     now = datetime.now()
-    
+
     # Check if weekend
     if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
         return False
-    
-    # Get market hours
-    hours = get_market_hours(exchange)
-    open_time = datetime.strptime(hours['open'], '%H:%M').time()
-    close_time = datetime.strptime(hours['close'], '%H:%M').time()
-    
-    current_time = now.time()
-    
-    return open_time <= current_time <= close_time
+
+    # Precomputed time boundaries: no strptime on the polling path
+    open_time, close_time = _MARKET_HOURS_TIMES.get(
+        exchange.upper(), _DEFAULT_MARKET_TIMES
+    )
+
+    return open_time <= now.time() <= close_time
 
 
 def truncate_string(s: str, max_length: int = 50) -> str:
@@ -361,7 +427,13 @@ def truncate_string(s: str, max_length: int = 50) -> str:
     Returns:
         Truncated string with '...' if needed
     """
+    # Common case (log pretty-printers, already-short strings) returns
+    # the original object — no copy, same identity
     if len(s) <= max_length:
         return s
-    return s[:max_length-3] + '...'
+    # Degenerate limits would slice with a negative index; just return
+    # as much of the suffix marker as fits
+    if max_length <= 3:
+        return _ELLIPSIS[:max_length]
+    return s[:max_length-3] + _ELLIPSIS
 
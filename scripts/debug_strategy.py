@@ -7,6 +7,7 @@ Run this before running the main strategy to diagnose issues.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -112,25 +113,35 @@ def debug_multiple_stocks():
     print()
     
     working_stocks = []
-    
-    for stock, exchange in test_stocks:
-        try:
-            data = trader.get_historical_data(
+
+    # Fire all fetches concurrently: each call is mostly network
+    # latency, so wall time is the slowest request instead of the sum
+    with ThreadPoolExecutor(max_workers=len(test_stocks)) as executor:
+        futures = {
+            executor.submit(
+                trader.get_historical_data,
                 stock=stock,
                 interval="1day",
                 from_date=from_date.strftime("%Y-%m-%d"),
                 to_date=to_date.strftime("%Y-%m-%d"),
                 exchange_code=exchange
-            )
-            
-            if data and len(data) > 0:
-                print(f"  ✓ {stock:10s} - {len(data)} days")
-                working_stocks.append((stock, exchange))
-            else:
-                print(f"  ✗ {stock:10s} - No data")
-                
-        except Exception as e:
-            print(f"  ✗ {stock:10s} - Error: {e}")
+            ): (stock, exchange)
+            for stock, exchange in test_stocks
+        }
+
+        for future in as_completed(futures):
+            stock, exchange = futures[future]
+            try:
+                data = future.result()
+
+                if data and len(data) > 0:
+                    print(f"  ✓ {stock:10s} - {len(data)} days")
+                    working_stocks.append((stock, exchange))
+                else:
+                    print(f"  ✗ {stock:10s} - No data")
+
+            except Exception as e:
+                print(f"  ✗ {stock:10s} - Error: {e}")
     
     if working_stocks:
         print(f"\n✓ Working stocks: {', '.join([s[0] for s in working_stocks])}")
@@ -169,26 +180,35 @@ def debug_date_range():
     print(f"\nTesting {stock} with different date ranges...")
     print()
     
-    for label, days in date_ranges:
-        to_date = datetime.now()
-        from_date = to_date - timedelta(days=days + 5)  # Extra buffer
-        
-        try:
-            data = trader.get_historical_data(
+    to_date = datetime.now()
+
+    # Same concurrency trick as debug_multiple_stocks: the four ranges
+    # are independent requests, so overlap their network latency.
+    # Results are printed in the original order for readability.
+    with ThreadPoolExecutor(max_workers=len(date_ranges)) as executor:
+        futures = [
+            (label, executor.submit(
+                trader.get_historical_data,
                 stock=stock,
                 interval="1day",
-                from_date=from_date.strftime("%Y-%m-%d"),
+                from_date=(to_date - timedelta(days=days + 5)).strftime("%Y-%m-%d"),  # Extra buffer
                 to_date=to_date.strftime("%Y-%m-%d"),
                 exchange_code=exchange
-            )
-            
-            if data and len(data) > 0:
-                print(f"  ✓ {label:15s} - {len(data)} days received")
-            else:
-                print(f"  ✗ {label:15s} - No data")
-                
-        except Exception as e:
-            print(f"  ✗ {label:15s} - Error: {e}")
+            ))
+            for label, days in date_ranges
+        ]
+
+        for label, future in futures:
+            try:
+                data = future.result()
+
+                if data and len(data) > 0:
+                    print(f"  ✓ {label:15s} - {len(data)} days received")
+                else:
+                    print(f"  ✗ {label:15s} - No data")
+
+            except Exception as e:
+                print(f"  ✗ {label:15s} - Error: {e}")
 
 
 def main():
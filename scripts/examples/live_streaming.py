@@ -7,34 +7,168 @@ This example shows how to stream live market data using WebSocket.
 WARNING: This is a blocking operation. Press Ctrl+C to stop.
 """
 
+import signal
 import sys
+import threading
 from pathlib import Path
 import time
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from breeze_client import BreezeTrader
+# BreezeTrader (and its requests/config machinery) is imported inside
+# main(): module import stays instant for --help style invocations
+
+# Ticks are buffered here and flushed in one stdout write every 100 ms:
+# at high tick rates this turns one print (lock + syscall) and one
+# strftime per tick into one of each per batch
+_FLUSH_INTERVAL = 0.1
+
+_tick_buf = []
+_tick_lock = threading.Lock()
+
+# Specialized field extractor, built from the first tick's keys: the
+# feed uses the same schema for every tick, so after one inspection
+# each tick costs one dict lookup per field instead of the nested
+# get-with-fallback chain
+_extract_tick = None
+
 
 def on_tick(tick_data):
     """
     Callback function for handling tick data.
-    
+
     Args:
         tick_data: Dictionary containing tick information
     """
-    # Extract relevant fields (structure may vary)
-    stock = tick_data.get('stock', tick_data.get('symbol', 'N/A'))
-    ltp = tick_data.get('ltp', tick_data.get('last_price', 'N/A'))
-    volume = tick_data.get('volume', 'N/A')
-    
-    print(f"[{time.strftime('%H:%M:%S')}] {stock}: ₹{ltp} | Vol: {volume}")
+    global _extract_tick
+    extract = _extract_tick
+
+    if extract is None:
+        # Inspect the schema once (structure varies by feed)
+        stock_key = 'stock' if 'stock' in tick_data else 'symbol'
+        ltp_key = 'ltp' if 'ltp' in tick_data else 'last_price'
+
+        def extract(tick, _sk=stock_key, _lk=ltp_key):
+            return (
+                tick.get(_sk, 'N/A'),
+                tick.get(_lk, 'N/A'),
+                tick.get('volume', 'N/A'),
+            )
+
+        _extract_tick = extract
+
+    fields = extract(tick_data)
+
+    if _publisher is not None:
+        _publisher.publish(*fields)
+
+    with _tick_lock:
+        _tick_buf.append(fields)
+
+
+def _flush_ticks():
+    """Drain the tick buffer into a single stdout write."""
+    with _tick_lock:
+        if not _tick_buf:
+            return
+        ticks = _tick_buf[:]
+        del _tick_buf[:]
+
+    # One timestamp per batch rather than per tick
+    stamp = time.strftime('%H:%M:%S')
+    sys.stdout.write(''.join(
+        f"[{stamp}] {stock}: ₹{ltp} | Vol: {volume}\n"
+        for stock, ltp, volume in ticks
+    ))
+    sys.stdout.flush()
+
+
+def _tick_flusher(stop_event):
+    """Background loop flushing buffered ticks until stop_event is set."""
+    while not stop_event.wait(_FLUSH_INTERVAL):
+        _flush_ticks()
+    _flush_ticks()  # final drain on shutdown
+
+
+class TickPublisher:
+    """
+    Zero-copy tick fan-out for downstream analysis processes.
+
+    Rows (timestamp, symbol id, ltp, volume — float64, struct-of-arrays)
+    go into a ring buffer living in multiprocessing shared memory.
+    Consumers attach by name with SharedMemory(name=...) and wrap the
+    same buffer in an ndarray — no pickling, no copies, no queue.
+    The first 8 bytes hold the monotonically growing write count so a
+    reader can tell how far the writer has advanced (and detect wrap).
+
+    Opt in with the --publish flag; see main().
+    """
+
+    COLUMNS = 4  # ts, symbol_id, ltp, volume
+
+    def __init__(self, name='breeze_ticks', capacity=16384):
+        # Imported here so the plain print-only streaming path doesn't
+        # pay for numpy/shared_memory at startup
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        self.capacity = capacity
+        nbytes = 8 + capacity * self.COLUMNS * 8
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+        self._counter = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf)
+        self._counter[0] = 0
+        self._rows = np.ndarray(
+            (capacity, self.COLUMNS), dtype=np.float64,
+            buffer=self._shm.buf, offset=8
+        )
+        self._lock = threading.Lock()
+        self._symbol_ids = {}
+        self.name = self._shm.name
+
+    def publish(self, stock, ltp, volume):
+        """Write one tick row; non-numeric fields drop the tick."""
+        try:
+            ltp_f = float(ltp)
+            vol_f = float(volume)
+        except (TypeError, ValueError):
+            return
+
+        with self._lock:
+            symbol_id = self._symbol_ids.setdefault(
+                stock, float(len(self._symbol_ids))
+            )
+            index = int(self._counter[0])
+            self._rows[index % self.capacity] = (
+                time.time(), symbol_id, ltp_f, vol_f
+            )
+            # Bump only after the row is fully written so readers never
+            # see a half-filled slot
+            self._counter[0] = index + 1
+
+    def close(self):
+        """Release the shared segment."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+# Set in main() when --publish is passed
+_publisher = None
 
 
 def main():
     """Stream live market data."""
+    global _publisher
+
+    from breeze_client import BreezeTrader
+
     # Initialize trader
     trader = BreezeTrader()
+
+    # Optional shared-memory fan-out for analysis processes
+    if '--publish' in sys.argv:
+        _publisher = TickPublisher()
+        print(f"📡 Publishing ticks to shared memory '{_publisher.name}'")
     
     print("=" * 60)
     print("  Live Data Streaming")
@@ -45,12 +179,18 @@ def main():
     print()
     print("-" * 60)
     
+    flusher_stop = threading.Event()
+    flusher = threading.Thread(
+        target=_tick_flusher, args=(flusher_stop,),
+        name='tick-flusher', daemon=True
+    )
+
     try:
         # Connect WebSocket
         trader.ws_connect()
         print("✅ WebSocket connected")
         print()
-        
+
         # Subscribe to live feeds
         trader.subscribe_feeds(
             stocks=["RELIANCE", "TCS", "INFY"],
@@ -58,20 +198,37 @@ def main():
             interval="1second",
             exchange_code="NSE"
         )
-        
-        # Keep running (this is blocking)
-        while True:
-            time.sleep(1)
-            
+        flusher.start()
+
+        # Keep running until Ctrl+C. Event.wait() blocks in the kernel
+        # with zero wakeups, unlike a sleep(1) poll loop that wakes the
+        # interpreter ~86k times a day just to re-check for interrupts
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        stop_event.wait()
+
+        print()
+        print("-" * 60)
+        print("⏹️  Streaming stopped by user")
+
     except KeyboardInterrupt:
         print()
         print("-" * 60)
         print("⏹️  Streaming stopped by user")
-        
+
     except Exception as e:
         print(f"❌ Error: {e}")
         
     finally:
+        # Stop the flusher (drains any remaining ticks)
+        flusher_stop.set()
+        if flusher.is_alive():
+            flusher.join(timeout=1)
+
+        if _publisher is not None:
+            _publisher.close()
+            _publisher = None
+
         # Disconnect WebSocket
         try:
             trader.ws_disconnect()
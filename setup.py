@@ -2,14 +2,44 @@
 Breeze Trading Client - Setup Configuration
 """
 
+import compileall
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 from pathlib import Path
 
 # Read README for long description
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text()
 
+# Opt-in mypyc compilation of the hot kwargs helpers in utils.py
+# (alias resolution and dict merging run on every trading call).
+# Off by default so regular installs stay pure Python; wheel builds
+# can export BREEZE_USE_MYPYC=1 to ship compiled extensions.
+ext_modules = []
+if os.environ.get("BREEZE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["breeze_client/utils.py"])
+
+
+class BuildPyWithBytecode(build_py):
+    """build_py that pre-compiles bytecode for the import-hot path.
+
+    Shipping .pyc files (at optimization levels 0 and 2) for the package
+    means the first `import breeze_client` after install skips the
+    parse/compile step entirely.
+    """
+
+    def run(self):
+        super().run()
+        compileall.compile_dir(self.build_lib, optimize=[0, 2], quiet=1)
+
+
 setup(
+    cmdclass={"build_py": BuildPyWithBytecode},
+    ext_modules=ext_modules,
     name="breeze-trader-client",
     version="1.0.0",
     author="Your Name",
@@ -49,6 +79,9 @@ setup(
             "pandas>=2.0.0",
             "numpy>=1.24.0",
         ],
+        "performance": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,110 @@
+"""
+Tests for OrderBatcher
+
+The batcher only needs a running event loop and callables to dispatch,
+so these tests drive it directly with plain recording functions. A
+single-worker default executor keeps dispatch order deterministic.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from breeze_client.batcher import OrderBatcher
+
+
+def _run(coro):
+    """Run a coroutine on a fresh loop with serial dispatch."""
+    async def _with_serial_executor():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        return await coro
+
+    return asyncio.run(_with_serial_executor())
+
+
+def test_submit_resolves_future():
+    """submit() returns a future that resolves to the call's result."""
+    batcher = OrderBatcher(trader=None, interval_ms=5)
+
+    def place_gtt(stock, quantity):
+        return {'Success': {'stock': stock, 'quantity': quantity}}
+
+    async def scenario():
+        future = batcher.submit(place_gtt, 'RELIANCE', quantity=10)
+        return await future
+
+    response = _run(scenario())
+    assert response['Success'] == {'stock': 'RELIANCE', 'quantity': 10}
+
+
+def test_submit_requires_running_loop():
+    """submit() outside an event loop is an error, not a silent queue."""
+    batcher = OrderBatcher(trader=None)
+    with pytest.raises(RuntimeError):
+        batcher.submit(lambda: None)
+
+
+def test_cancels_flush_before_placements():
+    """Within one flush window, cancels dispatch ahead of placements."""
+    order = []
+
+    def place_gtt(name):
+        order.append(('place', name))
+        return {}
+
+    def cancel_gtt(name):
+        order.append(('cancel', name))
+        return {}
+
+    async def scenario():
+        futures = [
+            batcher.submit(place_gtt, 'P1'),
+            batcher.submit(place_gtt, 'P2'),
+            batcher.submit(cancel_gtt, 'C1'),
+        ]
+        await asyncio.gather(*futures)
+
+    batcher = OrderBatcher(trader=None, interval_ms=50, max_batch_size=10)
+    _run(scenario())
+    assert order[0] == ('cancel', 'C1')
+    assert set(order[1:]) == {('place', 'P1'), ('place', 'P2')}
+
+
+def test_exception_propagates_to_future():
+    """A failing call rejects its own future; others still resolve."""
+    def place_good():
+        return {'Success': True}
+
+    def place_bad():
+        raise ValueError('rejected by exchange')
+
+    async def scenario():
+        good = batcher.submit(place_good)
+        bad = batcher.submit(place_bad)
+        results = await asyncio.gather(good, bad, return_exceptions=True)
+        return results
+
+    batcher = OrderBatcher(trader=None, interval_ms=5)
+    good_result, bad_result = _run(scenario())
+    assert good_result == {'Success': True}
+    assert isinstance(bad_result, ValueError)
+
+
+def test_oversized_burst_splits_into_batches():
+    """More submissions than max_batch_size all still resolve."""
+    seen = []
+
+    def place_gtt(index):
+        seen.append(index)
+        return index
+
+    async def scenario():
+        futures = [batcher.submit(place_gtt, i) for i in range(7)]
+        return await asyncio.gather(*futures)
+
+    batcher = OrderBatcher(trader=None, interval_ms=5, max_batch_size=3)
+    results = _run(scenario())
+    assert results == list(range(7))
+    assert sorted(seen) == list(range(7))
@@ -0,0 +1,736 @@
+"""
+Tests for BreezeTrader client
+
+The breeze-connect SDK is replaced with a recording fake installed in
+sys.modules, so the full client surface (orders, cached reads, batch
+APIs, GTT, streaming bookkeeping) runs offline against canned
+responses.
+"""
+
+import asyncio
+import sys
+import time
+import types
+
+import pytest
+
+from breeze_client.client import (
+    BreezeTrader,
+    _TickDispatcher,
+    _extract_success,
+    _to_sdk_str,
+)
+from breeze_client.exceptions import (
+    BreezeTraderError,
+    InsufficientFundsError,
+    NetworkError,
+    SessionExpiredError,
+)
+
+
+CONFIG_YAML = """
+credentials:
+  api_key: "test_api_key"
+  secret_key: "test_secret_key"
+  user_id: "TEST123"
+
+trading:
+  default_exchange: "NSE"
+  default_product: "cash"
+  confirm_orders: false
+  quote_cache_ttl_ms: 60000
+  portfolio_cache_ttl_ms: 60000
+  funds_cache_ttl_ms: 60000
+  batching:
+    thread_pool_size: 4
+    interval_ms: 10
+    max_batch_size: 5
+
+session:
+  validity_cache_seconds: 300
+  warn_before_expiry_minutes: 60
+
+notifications:
+  show_order_confirmations: false
+  alert_on_session_expiry: false
+
+logging:
+  level: "WARNING"
+"""
+
+
+class _FakeApiHandler:
+    """Counts generate_headers calls so header-cache tests can assert hits."""
+
+    def __init__(self):
+        self.header_calls = 0
+
+    def generate_headers(self, body):
+        self.header_calls += 1
+        return {'X-Checksum': f'sig-{self.header_calls}'}
+
+
+class FakeBreezeSDK:
+    """
+    Stand-in for breeze_connect.BreezeConnect.
+
+    Every method call is recorded as (name, args, kwargs). Responses are
+    looked up in self.responses by method name (a callable value is
+    invoked with the call's arguments); self.errors[name] makes the
+    method raise instead.
+    """
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key
+        self.calls = []
+        self.responses = {'generate_session': {'Status': 200}}
+        self.errors = {}
+        self.api_handler = _FakeApiHandler()
+
+    def _record(self, name, args, kwargs):
+        self.calls.append((name, args, kwargs))
+        error = self.errors.get(name)
+        if error is not None:
+            raise error
+        value = self.responses.get(name, {})
+        if callable(value):
+            return value(*args, **kwargs)
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            return self._record(name, args, kwargs)
+
+        return method
+
+    def calls_to(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+
+@pytest.fixture
+def fake_sdk_module(monkeypatch):
+    """Install a fake breeze_connect package into sys.modules."""
+    package = types.ModuleType('breeze_connect')
+    inner = types.ModuleType('breeze_connect.breeze_connect')
+    package.BreezeConnect = FakeBreezeSDK
+    package.breeze_connect = inner
+    monkeypatch.setitem(sys.modules, 'breeze_connect', package)
+    monkeypatch.setitem(sys.modules, 'breeze_connect.breeze_connect', inner)
+    return inner
+
+
+@pytest.fixture
+def trader(tmp_path, monkeypatch, fake_sdk_module):
+    """A BreezeTrader wired to the fake SDK with a valid session on disk."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.yaml').write_text(CONFIG_YAML)
+    expiry_epoch = int(time.time()) + 86400
+    (tmp_path / '.session_token').write_text(f"testtoken|{expiry_epoch}\n")
+    return BreezeTrader('config.yaml')
+
+
+@pytest.fixture
+def sdk(trader):
+    """The fake SDK instance behind the trader fixture."""
+    return trader._breeze_sdk
+
+
+# ==================== HELPERS ====================
+
+
+def test_to_sdk_str():
+    """Values are coerced to the string forms the SDK expects."""
+    assert _to_sdk_str('2450.5') == '2450.5'
+    assert _to_sdk_str(10) == '10'
+    assert _to_sdk_str(None) == ''
+
+
+def test_extract_success():
+    """Success payloads are unwrapped; empty envelopes yield the default."""
+    assert _extract_success({'Success': [1, 2]}) == [1, 2]
+    assert _extract_success({'Success': None}) == []
+    assert _extract_success(None) == []
+    assert _extract_success(None, default={}) == {}
+
+
+# ==================== INITIALIZATION & SESSION ====================
+
+
+def test_init_generates_sdk_session(trader, sdk, fake_sdk_module):
+    """__init__ authenticates the SDK and routes it through the pooled session."""
+    call = sdk.calls_to('generate_session')[0]
+    assert call[2]['api_secret'] == 'test_secret_key'
+    assert call[2]['session_token'] == 'testtoken'
+    # The SDK module's requests attribute is swapped for the shared
+    # keep-alive session
+    assert fake_sdk_module.requests is BreezeTrader._get_http_session()
+    assert trader.breeze is sdk
+
+
+def test_shared_http_session(trader):
+    """The pooled HTTP session is created once and reused."""
+    session = BreezeTrader._get_http_session()
+    assert BreezeTrader._get_http_session() is session
+    assert session.headers['Connection'] == 'keep-alive'
+
+
+def test_init_with_expired_session_raises(tmp_path, monkeypatch, fake_sdk_module):
+    """An expired on-disk session fails construction up front."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.yaml').write_text(CONFIG_YAML)
+    (tmp_path / '.session_token').write_text("stale|1000000000\n")
+    with pytest.raises(SessionExpiredError):
+        BreezeTrader('config.yaml')
+
+
+def test_session_info(trader):
+    """Session helpers report a valid session."""
+    assert trader.is_session_valid() is True
+    info = trader.get_session_info()
+    assert info['is_valid'] is True
+    assert info['time_until_expiry_seconds'] > 0
+    assert 'valid' in repr(trader)
+
+
+def test_check_session_raises_when_invalid(trader, monkeypatch):
+    """An invalidated session surfaces as SessionExpiredError on API calls."""
+    monkeypatch.setattr(trader._session_manager, 'is_valid', lambda: False)
+    trader._session_check_valid_until = 0.0
+    with pytest.raises(SessionExpiredError):
+        trader.get_funds()
+
+
+def test_reload_config_refreshes_defaults(trader, tmp_path):
+    """reload_config re-reads the file and refreshes cached defaults."""
+    (tmp_path / 'config.yaml').write_text(
+        CONFIG_YAML.replace('default_exchange: "NSE"', 'default_exchange: "BSE"')
+    )
+    trader.reload_config()
+    assert trader._default_exchange == 'BSE'
+    assert trader.config['trading']['default_exchange'] == 'BSE'
+
+
+def test_header_cache_memoizes_same_second(trader, sdk, monkeypatch):
+    """Identical bodies inside one second reuse the signed headers."""
+    monkeypatch.setattr('breeze_client.client.time.time', lambda: 1000.0)
+    handler = sdk.api_handler
+    first = handler.generate_headers('{"a":1}')
+    assert handler.generate_headers('{"a":1}') is first
+    assert handler.header_calls == 1
+    handler.generate_headers('{"b":2}')
+    assert handler.header_calls == 2
+
+
+# ==================== ORDERS ====================
+
+
+def test_buy_forwards_order_params(trader, sdk):
+    """buy() resolves aliases and forwards stringified params to the SDK."""
+    sdk.responses['place_order'] = {'Success': {'order_id': 'OID1'}}
+    response = trader.buy('RELIANCE', 10, type='limit', price=2450.5)
+    assert response['Success']['order_id'] == 'OID1'
+
+    name, args, kwargs = sdk.calls_to('place_order')[0]
+    assert kwargs['stock_code'] == 'RELIANCE'
+    assert kwargs['exchange_code'] == 'NSE'   # default exchange
+    assert kwargs['action'] == 'buy'
+    assert kwargs['order_type'] == 'limit'    # 'type' alias resolved
+    assert kwargs['quantity'] == '10'         # quantity stringified
+    assert kwargs['price'] == '2450.5'        # price stringified
+
+
+def test_sell_action(trader, sdk):
+    """sell() places a sell order."""
+    trader.sell('TCS', 5)
+    assert sdk.calls_to('place_order')[0][2]['action'] == 'sell'
+
+
+def test_order_invalidates_account_caches(trader, sdk):
+    """A filled order drops account caches but leaves quotes cached."""
+    sdk.responses['get_portfolio_holdings'] = {'Success': [{'stock': 'TCS'}]}
+    sdk.responses['get_quotes'] = {'Success': [{'ltp': 100}]}
+    sdk.responses['place_order'] = {'Success': {'order_id': 'OID1'}}
+
+    trader.get_portfolio()
+    trader.get_quote('TCS')
+    trader.buy('TCS', 1)
+
+    trader.get_portfolio()
+    trader.get_quote('TCS')
+    assert len(sdk.calls_to('get_portfolio_holdings')) == 2
+    assert len(sdk.calls_to('get_quotes')) == 1
+
+
+def test_place_order_error_translated(trader, sdk):
+    """SDK errors come back as the matching BreezeTraderError subclass."""
+    sdk.errors['place_order'] = Exception('insufficient funds')
+    with pytest.raises(InsufficientFundsError):
+        trader.buy('TCS', 1)
+
+
+def test_session_error_resets_check_cache(trader, sdk):
+    """A session-expired SDK error invalidates the cached session check."""
+    trader.get_funds()  # primes the session-check cache
+    assert trader._session_check_valid_until > 0
+    sdk.errors['place_order'] = Exception('session expired')
+    with pytest.raises(SessionExpiredError):
+        trader.buy('TCS', 1)
+    assert trader._session_check_valid_until == 0.0
+
+
+def test_confirm_orders(trader, sdk, monkeypatch):
+    """Order confirmation aborts on 'n' and proceeds on 'y'."""
+    trader._confirm_orders = True
+
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'n')
+    response = trader.buy('TCS', 1)
+    assert response['Status'] == 'cancelled'
+    assert not sdk.calls_to('place_order')
+
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'y')
+    trader.buy('TCS', 1)
+    assert len(sdk.calls_to('place_order')) == 1
+
+
+def test_place_orders_error_contract(trader, sdk):
+    """A failed order yields an error dict without aborting the batch."""
+    def _place(*args, **kwargs):
+        if kwargs['stock_code'] == 'BAD':
+            raise Exception('invalid stock')
+        return {'Success': {'order_id': kwargs['stock_code']}}
+
+    sdk.responses['place_order'] = _place
+    responses = trader.place_orders([
+        {'stock': 'RELIANCE', 'action': 'buy', 'quantity': 10},
+        {'stock': 'BAD', 'action': 'buy', 'quantity': 1},
+        {'stock': 'TCS', 'action': 'sell', 'quantity': 5},
+    ])
+    assert responses[0]['Success']['order_id'] == 'RELIANCE'
+    assert responses[1]['Status'] == 'error'
+    assert 'Error' in responses[1]
+    assert responses[2]['Success']['order_id'] == 'TCS'
+    assert trader.place_orders([]) == []
+
+
+def test_place_order_async(trader, sdk):
+    """place_order_async resolves to the order response."""
+    sdk.responses['place_order'] = {'Success': {'order_id': 'OID9'}}
+    future = trader.place_order_async('TCS', 'buy', 1)
+    assert future.result(timeout=5)['Success']['order_id'] == 'OID9'
+
+
+def test_modify_order(trader, sdk):
+    """modify_order stringifies numerics and passes the order id."""
+    trader.modify_order('ORDER1', quantity=20, price=100.5)
+    name, args, kwargs = sdk.calls_to('modify_order')[0]
+    assert kwargs['order_id'] == 'ORDER1'
+    assert kwargs['quantity'] == '20'
+    assert kwargs['price'] == '100.5'
+
+
+def test_cancel_order(trader, sdk):
+    """cancel_order uses the default exchange when none is given."""
+    trader.cancel_order('ORDER1')
+    assert sdk.calls_to('cancel_order')[0][2]['exchange_code'] == 'NSE'
+
+
+def test_get_order_and_orders(trader, sdk):
+    """Order reads unwrap the Success envelope."""
+    sdk.responses['get_order_detail'] = {'Success': [{'order_id': 'O1'}]}
+    assert trader.get_order('O1')['Success'][0]['order_id'] == 'O1'
+
+    sdk.responses['get_order_list'] = {'Success': [{'order_id': 'O1'}]}
+    assert trader.get_orders() == [{'order_id': 'O1'}]
+
+    sdk.responses['get_order_list'] = None
+    assert trader.get_orders() == []
+
+
+# ==================== CACHED READS ====================
+
+
+def test_quote_cached_within_ttl(trader, sdk):
+    """Repeated quotes inside the TTL are served from the cache."""
+    sdk.responses['get_quotes'] = {'Success': [{'ltp': 100}]}
+    first = trader.get_quote('TCS')
+    assert trader.get_quote('TCS') == first
+    assert len(sdk.calls_to('get_quotes')) == 1
+    trader.get_quote('INFY')  # different key
+    assert len(sdk.calls_to('get_quotes')) == 2
+
+
+def test_cached_responses_are_isolated_copies(trader, sdk):
+    """Mutating a returned payload doesn't corrupt later cache hits."""
+    sdk.responses['get_quotes'] = {'Success': [{'ltp': 100}]}
+    sdk.responses['get_portfolio_holdings'] = {'Success': [{'stock': 'TCS'}]}
+
+    quote = trader.get_quote('TCS')
+    quote['Status'] = 'mangled'
+    assert 'Status' not in trader.get_quote('TCS')
+
+    holdings = trader.get_portfolio()
+    holdings.clear()
+    assert trader.get_portfolio() == [{'stock': 'TCS'}]
+    assert len(sdk.calls_to('get_portfolio_holdings')) == 1
+
+
+def test_cache_store_purges_stale_entries(trader, sdk):
+    """Storing past the size threshold evicts entries older than the TTLs."""
+    stale_ts = time.monotonic() - 120.0  # older than the 60s TTLs
+    trader._response_cache = {
+        ('quote', f'STOCK{i}', 'NSE', ()): (stale_ts, {'ltp': i})
+        for i in range(trader._CACHE_PURGE_THRESHOLD)
+    }
+    trader.get_quote('TCS')
+    assert len(trader._response_cache) == 1
+
+
+def test_quote_cache_expires(trader, sdk):
+    """An entry older than the TTL is refetched."""
+    trader.get_quote('TCS')
+    # Age every cache entry past the 60s TTL
+    for key, (ts, value) in list(trader._response_cache.items()):
+        trader._response_cache[key] = (ts - 61.0, value)
+    trader.get_quote('TCS')
+    assert len(sdk.calls_to('get_quotes')) == 2
+
+
+def test_zero_ttl_disables_cache(trader, sdk):
+    """A non-positive TTL bypasses the cache entirely."""
+    trader._quote_cache_ttl_ms = 0
+    trader.get_quote('TCS')
+    trader.get_quote('TCS')
+    assert len(sdk.calls_to('get_quotes')) == 2
+
+
+def test_portfolio_and_positions_cached(trader, sdk):
+    """Portfolio and positions reads cache independently."""
+    sdk.responses['get_portfolio_holdings'] = {'Success': [{'stock': 'TCS'}]}
+    sdk.responses['get_portfolio_positions'] = {'Success': [{'stock': 'TCS'}]}
+    assert trader.get_portfolio() == [{'stock': 'TCS'}]
+    trader.get_portfolio()
+    assert trader.get_positions() == [{'stock': 'TCS'}]
+    trader.get_positions()
+    assert len(sdk.calls_to('get_portfolio_holdings')) == 1
+    assert len(sdk.calls_to('get_portfolio_positions')) == 1
+
+
+def test_funds_and_margin_cached(trader, sdk):
+    """Funds and margin share the funds TTL but cache under separate keys."""
+    sdk.responses['get_funds'] = {'Success': {'cash': 1}}
+    sdk.responses['get_margin'] = {'Success': {'margin': 2}}
+    trader.get_funds()
+    trader.get_funds()
+    trader.get_margin()
+    trader.get_margin()
+    assert len(sdk.calls_to('get_funds')) == 1
+    assert len(sdk.calls_to('get_margin')) == 1
+
+
+def test_get_quotes_bulk(trader, sdk):
+    """Bulk quotes map symbol to response with per-symbol error dicts."""
+    def _quotes(**kwargs):
+        if kwargs['stock_code'] == 'BAD':
+            raise Exception('connection refused')
+        return {'Success': [{'stock': kwargs['stock_code']}]}
+
+    sdk.responses['get_quotes'] = _quotes
+    quotes = trader.get_quotes_bulk(['RELIANCE', 'BAD', 'TCS'])
+    assert quotes['RELIANCE']['Success'][0]['stock'] == 'RELIANCE'
+    assert quotes['BAD']['Status'] == 'error'
+    assert quotes['TCS']['Success'][0]['stock'] == 'TCS'
+    assert trader.get_quotes_bulk([]) == {}
+
+
+def test_get_historical_data_date_suffix(trader, sdk):
+    """Bare dates get the time suffix; timed dates pass unchanged."""
+    sdk.responses['get_historical_data_v2'] = {'Success': [
+        {'datetime': '2025-01-01T07:00:00.000Z', 'close': '100.5', 'volume': '10'},
+    ]}
+    rows = trader.get_historical_data(
+        'TCS', from_date='2025-01-01', to_date='2025-01-31T10:00:00.000Z'
+    )
+    assert rows[0]['close'] == '100.5'
+    kwargs = sdk.calls_to('get_historical_data_v2')[0][2]
+    assert kwargs['from_date'] == '2025-01-01T07:00:00.000Z'
+    assert kwargs['to_date'] == '2025-01-31T10:00:00.000Z'
+
+
+def test_get_historical_data_as_frame(trader, sdk):
+    """as_frame=True returns a typed DataFrame."""
+    pd = pytest.importorskip('pandas')
+    sdk.responses['get_historical_data_v2'] = {'Success': [
+        {'datetime': '2025-01-01T07:00:00.000Z', 'close': '100.5', 'volume': '10'},
+        {'datetime': '2025-01-02T07:00:00.000Z', 'close': '101.0', 'volume': '12'},
+    ]}
+    df = trader.get_historical_data('TCS', as_frame=True)
+    assert isinstance(df, pd.DataFrame)
+    assert df['close'].dtype == 'float64'
+    assert str(df['datetime'].dtype).startswith('datetime64')
+
+
+def test_get_option_chain_and_customer_details(trader, sdk):
+    """Option chain and customer detail calls pass through."""
+    sdk.responses['get_option_chain_quotes'] = {'Success': [{'strike': 100}]}
+    assert trader.get_option_chain(stock_code='NIFTY')['Success']
+
+    sdk.responses['get_customer_details'] = {'Success': {'name': 'Test'}}
+    assert trader.get_customer_details()['Success']['name'] == 'Test'
+    assert sdk.calls_to('get_customer_details')[0][2]['api_session'] == 'testtoken'
+
+
+def test_square_off_invalidates_caches(trader, sdk):
+    """square_off drops the account caches like any order mutation."""
+    sdk.responses['get_funds'] = {'Success': {'cash': 1}}
+    trader.get_funds()
+    trader.square_off(stock_code='TCS', quantity=1, action='sell')
+    trader.get_funds()
+    assert len(sdk.calls_to('get_funds')) == 2
+
+
+def test_async_variants(trader, sdk):
+    """The aget_* wrappers resolve to the sync results."""
+    sdk.responses['get_funds'] = {'Success': {'cash': 1}}
+    sdk.responses['get_quotes'] = {'Success': [{'ltp': 100}]}
+
+    async def _gather():
+        return await asyncio.gather(
+            trader.aget_quote('TCS'),
+            trader.aget_portfolio(),
+            trader.aget_positions(),
+            trader.aget_funds(),
+            trader.aget_margin(),
+        )
+
+    quote, portfolio, positions, funds, margin = asyncio.run(_gather())
+    assert quote['Success'][0]['ltp'] == 100
+    assert funds['Success']['cash'] == 1
+
+
+# ==================== GTT ORDERS ====================
+
+
+def test_place_gtt_single(trader, sdk):
+    """A single GTT carries trigger/limit prices and stringified fields."""
+    sdk.responses['place_gtt_order'] = {'Success': {'gtt_order_id': 'G1'}}
+    response = trader.place_gtt(
+        'TATAMOTORS', quantity=50, action='buy',
+        trigger_price=800, limit_price=805,
+    )
+    assert response['Success']['gtt_order_id'] == 'G1'
+    kwargs = sdk.calls_to('place_gtt_order')[0][2]
+    assert kwargs['stock_code'] == 'TATAMOTORS'
+    assert kwargs['quantity'] == '50'
+    assert kwargs['trigger_price'] == '800'
+    assert kwargs['limit_price'] == '805'
+    assert kwargs['order_type'] == 'limit'
+
+
+def test_place_gtt_oco(trader, sdk):
+    """An OCO GTT forwards order_details instead of trigger/limit."""
+    legs = [{'gtt_leg_type': 'target', 'action': 'sell'}]
+    trader.place_gtt('TATAMOTORS', quantity=50, gtt_type='cover_oco',
+                     order_details=legs)
+    kwargs = sdk.calls_to('place_gtt_order')[0][2]
+    assert kwargs['order_details'] == legs
+    assert 'trigger_price' not in kwargs
+
+
+def test_place_gtt_batch_error_contract(trader, sdk):
+    """A failed GTT leg yields an error dict; the rest still place."""
+    def _place(**kwargs):
+        if kwargs['stock_code'] == 'BAD':
+            raise Exception('invalid stock')
+        return {'Success': {'gtt_order_id': kwargs['stock_code']}}
+
+    sdk.responses['place_gtt_order'] = _place
+    responses = trader.place_gtt_batch([
+        {'stock': 'RELIANCE', 'quantity': 10, 'action': 'buy',
+         'trigger_price': 2900, 'limit_price': 2895},
+        {'stock': 'BAD', 'quantity': 1, 'action': 'buy'},
+    ])
+    assert responses[0]['Success']['gtt_order_id'] == 'RELIANCE'
+    assert responses[1]['Status'] == 'error'
+    assert trader.place_gtt_batch([]) == []
+
+
+def test_gtt_read_modify_cancel(trader, sdk):
+    """GTT book reads, modifies and cancels pass through to the SDK."""
+    trader.get_gtt_orders()
+    assert sdk.calls_to('get_gtt_order_list')[0][2]['exchange_code'] == 'NSE'
+
+    trader.modify_gtt('G1', gtt_type='single', order_details=[])
+    assert sdk.calls_to('modify_gtt_order')[0][2]['gtt_order_id'] == 'G1'
+
+    trader.cancel_gtt('G1')
+    assert sdk.calls_to('cancel_gtt_order')[0][2]['gtt_order_id'] == 'G1'
+
+
+def test_cancel_gtt_batch_error_contract(trader, sdk):
+    """Batch GTT cancels keep order and convert failures to error dicts."""
+    def _cancel(**kwargs):
+        if kwargs['gtt_order_id'] == 'BAD':
+            raise Exception('order not found')
+        return {'Success': {'gtt_order_id': kwargs['gtt_order_id']}}
+
+    sdk.responses['cancel_gtt_order'] = _cancel
+    responses = trader.cancel_gtt_batch(['G1', 'BAD', 'G2'])
+    assert responses[0]['Success']['gtt_order_id'] == 'G1'
+    assert responses[1]['Status'] == 'error'
+    assert responses[2]['Success']['gtt_order_id'] == 'G2'
+    assert trader.cancel_gtt_batch([]) == []
+
+
+def test_gtt_batch_flag_uses_micro_batcher(trader, sdk):
+    """batch=True queues on the micro-batcher and resolves via a Future."""
+    sdk.responses['place_gtt_order'] = {'Success': {'gtt_order_id': 'G1'}}
+
+    async def _run():
+        future = trader.place_gtt(
+            'RELIANCE', quantity=10, action='buy',
+            trigger_price=2900, limit_price=2895, batch=True,
+        )
+        placed = await future
+        cancelled = await trader.cancel_gtt('G1', batch=True)
+        return placed, cancelled
+
+    placed, cancelled = asyncio.run(_run())
+    assert placed['Success']['gtt_order_id'] == 'G1'
+    assert sdk.calls_to('cancel_gtt_order')
+
+
+# ==================== LIVE STREAMING ====================
+
+
+def test_subscribe_feeds_registers_after_success(trader, sdk):
+    """A successful subscribe records the symbols and the callback."""
+    callback = lambda tick: None
+    trader.subscribe_feeds(['RELIANCE', 'TCS'], callback)
+    kwargs = sdk.calls_to('subscribe_feeds')[0][2]
+    assert kwargs['stock_token'] == ['RELIANCE', 'TCS']
+    assert trader._tick_callbacks['RELIANCE'] == [callback]
+    assert trader._subscribed_by_exchange['NSE'] == {'RELIANCE', 'TCS'}
+
+
+def test_subscribe_feeds_incremental(trader, sdk):
+    """Re-subscribing only forwards symbols not already streaming."""
+    first = lambda tick: None
+    second = lambda tick: None
+    trader.subscribe_feeds(['RELIANCE'], first)
+    trader.subscribe_feeds(['RELIANCE', 'TCS'], second)
+    calls = sdk.calls_to('subscribe_feeds')
+    assert len(calls) == 2
+    assert calls[1][2]['stock_token'] == ['TCS']
+    # Both callbacks multiplex over the shared subscription
+    assert trader._tick_callbacks['RELIANCE'] == [first, second]
+
+
+def test_subscribe_feeds_failure_leaves_no_orphans(trader, sdk):
+    """A failed SDK subscribe registers no callbacks or symbols."""
+    sdk.errors['subscribe_feeds'] = Exception('connection refused')
+    with pytest.raises(NetworkError):
+        trader.subscribe_feeds(['RELIANCE'], lambda tick: None)
+    assert trader._tick_callbacks == {}
+    assert trader._subscribed_by_exchange['NSE'] == set()
+
+
+def test_unsubscribe_feeds(trader, sdk):
+    """Unsubscribing drops the bookkeeping; unknown symbols are ignored."""
+    trader.subscribe_feeds(['RELIANCE', 'TCS'], lambda tick: None)
+    trader.unsubscribe_feeds(['RELIANCE', 'UNKNOWN'])
+    assert sdk.calls_to('unsubscribe_feeds')[0][2]['stock_token'] == ['RELIANCE']
+    assert 'RELIANCE' not in trader._tick_callbacks
+    assert trader._subscribed_by_exchange['NSE'] == {'TCS'}
+
+    trader.unsubscribe_feeds(['UNKNOWN'])
+    assert len(sdk.calls_to('unsubscribe_feeds')) == 1
+
+
+def test_ws_disconnect_resets_subscriptions(trader, sdk):
+    """A reconnect after ws_disconnect re-subscribes on the new socket."""
+    trader.subscribe_feeds(['RELIANCE'], lambda tick: None)
+    trader.ws_disconnect()
+    assert trader._subscribed_by_exchange == {}
+    assert trader._tick_callbacks == {}
+
+    trader.ws_connect()
+    trader.subscribe_feeds(['RELIANCE'], lambda tick: None)
+    assert len(sdk.calls_to('subscribe_feeds')) == 2
+
+
+def test_dispatch_tick_routes_by_symbol(trader):
+    """Ticks route to the symbol's callbacks; unknown ticks fan out once."""
+    seen = []
+    trader._tick_callbacks['RELIANCE'] = [lambda t: seen.append(('R', t))]
+    trader._tick_callbacks['TCS'] = [lambda t: seen.append(('T', t))]
+
+    trader._dispatch_tick({'stock_code': 'RELIANCE', 'ltp': 100})
+    assert seen == [('R', {'stock_code': 'RELIANCE', 'ltp': 100})]
+
+    # Unidentifiable tick fans out to every callback exactly once
+    seen.clear()
+    trader._dispatch_tick({'ltp': 101})
+    assert sorted(tag for tag, _ in seen) == ['R', 'T']
+
+
+def test_subscribe_order_updates(trader, sdk):
+    """Order update subscription passes the callback through."""
+    callback = lambda update: None
+    trader.subscribe_order_updates(callback)
+    assert sdk.calls_to('subscribe_order_notification')[0][2]['on_update'] is callback
+
+
+def test_tick_dispatcher_delivery_and_drop():
+    """The dispatcher delivers off-thread, survives callback errors,
+    counts drops when full, and stops cleanly."""
+    import threading
+
+    received = []
+    release = threading.Event()
+
+    def callback(tick):
+        if tick == 'block':
+            release.wait(timeout=5)
+        elif tick == 'boom':
+            raise ValueError('boom')
+        else:
+            received.append(tick)
+
+    dispatcher = _TickDispatcher(callback, maxsize=1)
+    dispatcher.push('block')       # consumer blocks in the callback
+    time.sleep(0.05)               # let it dequeue before filling the queue
+    dispatcher.push('boom')        # fills the queue (maxsize=1)
+    dispatcher.push('tick-1')      # queue full: dropped
+    assert dispatcher.dropped_ticks >= 1
+
+    release.set()
+    # Keep pushing until the consumer drains the queue and delivers
+    for _ in range(100):
+        dispatcher.push('tick-2')
+        if 'tick-2' in received:
+            break
+        time.sleep(0.01)
+    assert 'tick-2' in received
+    dispatcher.stop()
+
+
+def test_tick_dispatcher_stop_bounded_when_queue_full():
+    """stop() returns within its timeout even with the consumer wedged
+    in a callback and the queue at capacity."""
+    import threading
+
+    release = threading.Event()
+    dispatcher = _TickDispatcher(lambda tick: release.wait(timeout=5),
+                                 maxsize=1)
+    dispatcher.push('block')   # consumer dequeues this and wedges
+    time.sleep(0.05)
+    dispatcher.push('fill')    # queue full again
+
+    start = time.monotonic()
+    dispatcher.stop(timeout=0.2)
+    assert time.monotonic() - start < 2.0
+
+    release.set()
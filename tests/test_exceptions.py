@@ -168,3 +168,13 @@ def test_translate_sdk_error_generic():
     assert isinstance(translated, BreezeTraderError)
     assert "Some unknown error" in str(translated)
 
+
+
+def test_package_all_includes_every_exception():
+    """Test that package __all__ stays in sync with exceptions.__all__."""
+    import breeze_client
+    from breeze_client import exceptions
+
+    for name in exceptions.__all__:
+        assert name in breeze_client.__all__
+        assert hasattr(breeze_client, name)